@@ -747,7 +747,7 @@ async def analyze(payload: Dict[str, Any]) -> JSONResponse:
                     network_analyzer = NetworkAnalyzer()
                     # Construct adjacency from first 2 covariates as coordinates
                     coords = X_arr[:, :2]
-                    adjacency = network_analyzer.ht.construct_adjacency_from_distance(coords, threshold=config.get("parameters", {}).get("estimators", {}).get("network", {}).get("adjacency_threshold", 0.5))
+                    adjacency = network_analyzer.construct_adjacency_from_distance(coords, threshold=config.get("parameters", {}).get("estimators", {}).get("network", {}).get("adjacency_threshold", 0.5))
                     network_result = network_analyzer.estimate(y_arr, t_arr, adjacency, X_arr, method=config.get("parameters", {}).get("estimators", {}).get("network", {}).get("method", "linear_in_means"))
                     tau_val = network_result.direct_effect
                     se_val = network_result.direct_se
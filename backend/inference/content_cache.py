@@ -0,0 +1,64 @@
+# backend/inference/content_cache.py
+"""
+Content-Keyed LRU Caches
+Reuse expensive intermediate results (adjacency matrices, causal discovery
+runs) across repeated calls on equal inputs, keyed by a hash of the data
+rather than object identity
+"""
+from collections import OrderedDict
+import hashlib
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def array_digest(a: np.ndarray) -> Tuple[bytes, Tuple[int, ...], str]:
+    """Content hash of an array, qualified by shape and dtype"""
+    a = np.ascontiguousarray(a)
+    return hashlib.blake2b(a.tobytes(), digest_size=16).digest(), a.shape, a.dtype.str
+
+
+def pandas_digest(obj) -> Tuple[bytes, int]:
+    """Content hash of a DataFrame/Series/Index (values and their order)"""
+    hashed = pd.util.hash_pandas_object(obj, index=False).values
+    return hashlib.blake2b(hashed.tobytes(), digest_size=16).digest(), len(obj)
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry (most recent last)"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value for `key` (marked as most recently used), or None"""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value`, evicting the least recently used entry when full"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Cached value for `key`, calling `build()` only on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
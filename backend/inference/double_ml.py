@@ -12,7 +12,7 @@ import numpy as np
 import pandas as pd
 from typing import Optional, Tuple, Callable, Any, Dict
 from dataclasses import dataclass
-from sklearn.model_selection import KFold
+from sklearn.model_selection import KFold, StratifiedKFold
 from sklearn.base import clone
 import warnings
 
@@ -31,6 +31,17 @@ class DMLResult:
     convergence: bool  # Whether estimation converged
 
 
+def _as_contiguous(a: Any, dtype: Optional[type] = None) -> np.ndarray:
+    """Convert array-like input (including pandas objects) to a C-contiguous ndarray.
+
+    pandas inputs are unwrapped with ``to_numpy(copy=False)`` so no copy is made
+    when the underlying block already has the requested layout and dtype.
+    """
+    if isinstance(a, (pd.DataFrame, pd.Series)):
+        a = a.to_numpy(copy=False)
+    return np.ascontiguousarray(a, dtype=dtype)
+
+
 class DoubleMachineLearning:
     """
     Double/Debiased Machine Learning
@@ -55,7 +66,8 @@ class DoubleMachineLearning:
         n_rep: int = 1,
         dml_procedure: str = "dml2",
         draw_sample_splitting: bool = True,
-        apply_cross_fitting: bool = True
+        apply_cross_fitting: bool = True,
+        random_state: Optional[int] = 42
     ):
         """
         Args:
@@ -68,6 +80,7 @@ class DoubleMachineLearning:
                 - dml2: Pool scores then estimate (preferred)
             draw_sample_splitting: Randomly draw folds (vs sequential)
             apply_cross_fitting: Use cross-fitting (True) or sample splitting (False)
+            random_state: Seed for fold assignment (default: 42)
         """
         self.ml_g = ml_g
         self.ml_m = ml_m
@@ -76,6 +89,7 @@ class DoubleMachineLearning:
         self.dml_procedure = dml_procedure
         self.draw_sample_splitting = draw_sample_splitting
         self.apply_cross_fitting = apply_cross_fitting
+        self.random_state = random_state
 
     def fit_plr(
         self,
@@ -105,6 +119,9 @@ class DoubleMachineLearning:
         Returns:
             DMLResult with treatment effect estimate
         """
+        X = _as_contiguous(X, np.float64)
+        y = _as_contiguous(y, np.float64)
+        d = _as_contiguous(d)
         n = len(y)
 
         # Storage for cross-fitted predictions
@@ -113,7 +130,11 @@ class DoubleMachineLearning:
 
         # Cross-fitting
         if self.apply_cross_fitting:
-            kf = KFold(n_splits=self.n_folds, shuffle=self.draw_sample_splitting, random_state=42)
+            kf = KFold(
+                n_splits=self.n_folds,
+                shuffle=self.draw_sample_splitting,
+                random_state=self.random_state if self.draw_sample_splitting else None
+            )
 
             for train_idx, test_idx in kf.split(X):
                 # Train on fold
@@ -209,6 +230,9 @@ class DoubleMachineLearning:
         Returns:
             DMLResult with ATE estimate
         """
+        X = _as_contiguous(X, np.float64)
+        y = _as_contiguous(y, np.float64)
+        d = _as_contiguous(d)
         n = len(y)
 
         # Validate binary treatment
@@ -222,9 +246,21 @@ class DoubleMachineLearning:
 
         # Cross-fitting
         if self.apply_cross_fitting:
-            kf = KFold(n_splits=self.n_folds, shuffle=self.draw_sample_splitting, random_state=42)
-
-            for train_idx, test_idx in kf.split(X):
+            # Stratify on D so every training fold contains both treated and
+            # control units, even when treatment is rare
+            n_minority = int(min(d.sum(), n - d.sum()))
+            if n_minority < self.n_folds:
+                raise ValueError(
+                    f"IRM cross-fitting needs at least n_folds={self.n_folds} units "
+                    f"in each treatment arm (smallest arm has {n_minority})"
+                )
+            skf = StratifiedKFold(
+                n_splits=self.n_folds,
+                shuffle=self.draw_sample_splitting,
+                random_state=self.random_state if self.draw_sample_splitting else None
+            )
+
+            for train_idx, test_idx in skf.split(X, d):
                 X_train, y_train, d_train = X[train_idx], y[train_idx], d[train_idx]
                 X_test = X[test_idx]
 
@@ -234,15 +270,13 @@ class DoubleMachineLearning:
 
                 # Train on control group
                 mask_control = (d_train == 0)
-                if mask_control.sum() > 0:
-                    ml_g0.fit(X_train[mask_control], y_train[mask_control])
-                    g0_hat[test_idx] = ml_g0.predict(X_test)
+                ml_g0.fit(X_train[mask_control], y_train[mask_control])
+                g0_hat[test_idx] = ml_g0.predict(X_test)
 
                 # Train on treated group
                 mask_treated = (d_train == 1)
-                if mask_treated.sum() > 0:
-                    ml_g1.fit(X_train[mask_treated], y_train[mask_treated])
-                    g1_hat[test_idx] = ml_g1.predict(X_test)
+                ml_g1.fit(X_train[mask_treated], y_train[mask_treated])
+                g1_hat[test_idx] = ml_g1.predict(X_test)
 
                 # Propensity score
                 ml_m_fold = clone(self.ml_m)
@@ -333,7 +367,8 @@ def estimate_ate_dml(
     ml_model_m: Optional[Any] = None,
     n_folds: int = 5,
     method: str = "irm",
-    alpha: float = 0.05
+    alpha: float = 0.05,
+    random_state: Optional[int] = 42
 ) -> DMLResult:
     """
     Convenience function for DML ATE estimation
@@ -347,6 +382,7 @@ def estimate_ate_dml(
         n_folds: Number of CV folds
         method: "irm" or "plr"
         alpha: Significance level
+        random_state: Seed for fold assignment
 
     Returns:
         DMLResult
@@ -377,7 +413,8 @@ def estimate_ate_dml(
         ml_g=ml_model_g,
         ml_m=ml_model_m,
         n_folds=n_folds,
-        dml_procedure="dml2"
+        dml_procedure="dml2",
+        random_state=random_state
     )
 
     # Fit
@@ -4,91 +4,115 @@ Estimator-specific Column Validation
 Validates that required columns exist for each estimator and provides fallback logic
 """
 from __future__ import annotations
+import re
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple, Set
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EstimatorRequirements:
     """Required and optional columns for each estimator"""
     name: str
-    required: List[str]  # Must have these columns
-    optional: List[str]  # Nice to have (enables extra features)
+    required: Tuple[str, ...]  # Must have these columns
+    optional: Tuple[str, ...]  # Nice to have (enables extra features)
     fallback: Optional[str] = None  # Fallback estimator if requirements not met
+    required_set: FrozenSet[str] = field(init=False, repr=False)
+    optional_set: FrozenSet[str] = field(init=False, repr=False)
 
+    def __post_init__(self):
+        # frozen: derived fields must be set through object.__setattr__
+        object.__setattr__(self, "required", tuple(self.required))
+        object.__setattr__(self, "optional", tuple(self.optional))
+        object.__setattr__(self, "required_set", frozenset(self.required))
+        object.__setattr__(self, "optional_set", frozenset(self.optional))
 
-# Estimator specifications
-ESTIMATOR_SPECS = {
+
+# Estimator specifications (read-only)
+ESTIMATOR_SPECS: Mapping[str, EstimatorRequirements] = MappingProxyType({
     "tvce": EstimatorRequirements(
         name="Time-Varying Causal Effects (TVCE)",
-        required=["y", "treatment"],
-        optional=["time", "unit_id"],
+        required=("y", "treatment"),
+        optional=("time", "unit_id"),
         fallback="simple_diff"
     ),
     "ope": EstimatorRequirements(
         name="Off-Policy Evaluation (OPE/IPW)",
-        required=["y", "treatment", "log_propensity"],
-        optional=["unit_id"],
+        required=("y", "treatment", "log_propensity"),
+        optional=("unit_id",),
         fallback="tvce"
     ),
     "hidden": EstimatorRequirements(
         name="Hidden Confounding (Sensitivity)",
-        required=["y", "treatment"],
-        optional=["unit_id", "covariates"],
+        required=("y", "treatment"),
+        optional=("unit_id", "covariates"),
         fallback="tvce"
     ),
     "iv": EstimatorRequirements(
         name="Instrumental Variables (2SLS)",
-        required=["y", "treatment", "z"],  # z = instrument
-        optional=["unit_id", "covariates"],
+        required=("y", "treatment", "z"),  # z = instrument
+        optional=("unit_id", "covariates"),
         fallback="tvce"
     ),
     "transport": EstimatorRequirements(
         name="Transportability (IPSW)",
-        required=["y", "treatment", "domain"],
-        optional=["unit_id"],
+        required=("y", "treatment", "domain"),
+        optional=("unit_id",),
         fallback="tvce"
     ),
     "proximal": EstimatorRequirements(
         name="Proximal Causal Inference",
-        required=["y", "treatment", "w_neg", "z_neg"],
-        optional=["unit_id"],
+        required=("y", "treatment", "w_neg", "z_neg"),
+        optional=("unit_id",),
         fallback="tvce"
     ),
     "network": EstimatorRequirements(
         name="Network Effects",
-        required=["y", "treatment", "cluster_id", "neighbor_exposure"],
-        optional=["unit_id"],
+        required=("y", "treatment", "cluster_id", "neighbor_exposure"),
+        optional=("unit_id",),
         fallback="tvce"
     ),
     "synthetic_control": EstimatorRequirements(
         name="Synthetic Control Method",
-        required=["y", "treatment", "unit_id", "time"],
-        optional=["covariates"],
+        required=("y", "treatment", "unit_id", "time"),
+        optional=("covariates",),
         fallback="tvce"
     ),
     "causal_forest": EstimatorRequirements(
         name="Causal Forests",
-        required=["y", "treatment", "covariates"],
-        optional=["unit_id"],
+        required=("y", "treatment", "covariates"),
+        optional=("unit_id",),
         fallback="tvce"
     ),
     "rd": EstimatorRequirements(
         name="Regression Discontinuity",
-        required=["y", "treatment", "covariates"],
-        optional=["unit_id", "time"],
+        required=("y", "treatment", "covariates"),
+        optional=("unit_id", "time"),
         fallback="tvce"
     ),
     "did": EstimatorRequirements(
         name="Difference-in-Differences",
-        required=["y", "treatment", "unit_id", "time"],
-        optional=["covariates"],
+        required=("y", "treatment", "unit_id", "time"),
+        optional=("covariates",),
         fallback="tvce"
     ),
+})
+
+
+# Column-name heuristics for auto-detecting special roles (substring match on lowercased names)
+_ROLE_PATTERNS = {
+    "log_propensity": re.compile(r"propensity|prob|score|ps"),
+    "cost": re.compile(r"cost|price|expense|spend"),
+    "domain": re.compile(r"domain|site|location|source"),
+    "cluster_id": re.compile(r"cluster|group|cohort"),
+    "z": re.compile(r"instrument|iv|z"),
 }
 
+# Roles resolved by ColumnSelector rather than by name patterns
+_STANDARD_ROLES = ("y", "treatment", "unit_id", "time")
+
 
 class EstimatorValidator:
     """Validates column requirements for estimators"""
@@ -97,11 +121,28 @@ class EstimatorValidator:
         """
         Args:
             df: Input dataframe
-            mapping: User-provided mapping (role -> column name)
+            mapping: User-provided mapping (role -> column name). Treated as
+                immutable; assign a new dict to ``validator.mapping`` to
+                re-validate against a different mapping.
         """
         self.df = df
+        self.available_columns = frozenset(df.columns)
         self.mapping = mapping
-        self.available_columns = set(df.columns)
+
+    @property
+    def mapping(self) -> Dict[str, str]:
+        return self._mapping
+
+    @mapping.setter
+    def mapping(self, mapping: Dict[str, str]) -> None:
+        self._mapping = mapping
+        # Roles whose mapped column actually exists in df
+        self._resolved_mapping = {
+            role: col for role, col in mapping.items()
+            if col and col in self.available_columns
+        }
+        self._validation_cache: Optional[Dict[str, Dict[str, any]]] = None
+        self._auto_detected: Optional[Dict[str, Optional[str]]] = None
 
     def validate_estimator(self, estimator: str) -> Dict[str, any]:
         """
@@ -126,21 +167,20 @@ class EstimatorValidator:
 
         spec = ESTIMATOR_SPECS[estimator]
 
-        # Check required columns
-        missing_required = []
-        for role in spec.required:
-            col = self.mapping.get(role)
-            if not col or col not in self.available_columns:
-                missing_required.append(role)
-
-        # Check optional columns
-        missing_optional = []
-        for role in spec.optional:
-            col = self.mapping.get(role)
-            if not col or col not in self.available_columns:
-                missing_optional.append(role)
-
-        can_run = len(missing_required) == 0
+        # Set difference against resolved roles; lists keep spec order for messages
+        resolved = self._resolved_mapping.keys()
+        missing_required_set = spec.required_set - resolved
+        missing_optional_set = spec.optional_set - resolved
+        missing_required = (
+            [role for role in spec.required if role in missing_required_set]
+            if missing_required_set else []
+        )
+        missing_optional = (
+            [role for role in spec.optional if role in missing_optional_set]
+            if missing_optional_set else []
+        )
+
+        can_run = not missing_required_set
 
         # Generate message
         if can_run:
@@ -161,11 +201,13 @@ class EstimatorValidator:
         }
 
     def validate_all(self) -> Dict[str, Dict[str, any]]:
-        """Validate all estimators"""
-        results = {}
-        for estimator in ESTIMATOR_SPECS.keys():
-            results[estimator] = self.validate_estimator(estimator)
-        return results
+        """Validate all estimators (computed once per mapping)"""
+        if self._validation_cache is None:
+            results = {}
+            for estimator in ESTIMATOR_SPECS.keys():
+                results[estimator] = self.validate_estimator(estimator)
+            self._validation_cache = results
+        return self._validation_cache
 
     def get_runnable_estimators(self) -> List[str]:
         """Get list of estimators that can run with current data"""
@@ -175,70 +217,53 @@ class EstimatorValidator:
     def auto_detect_missing_columns(self) -> Dict[str, Optional[str]]:
         """
         Attempt to auto-detect missing columns based on heuristics
+        (computed once per mapping)
 
         Returns:
             Dict mapping role -> detected column name (or None)
         """
-        from .column_selection import ColumnSelector
-
-        selector = ColumnSelector(self.df)
-        selection = selector.select_columns(confidence_threshold=0.2)
+        if self._auto_detected is None:
+            self._auto_detected = self._detect_missing_columns()
+        return self._auto_detected
+
+    def _detect_missing_columns(self) -> Dict[str, Optional[str]]:
+        needed = {
+            role for role in (*_STANDARD_ROLES, *_ROLE_PATTERNS)
+            if not self.mapping.get(role)
+        }
+        if not needed:
+            return {}
 
         # Map selection results to role names
         detected = {}
 
         # Standard roles
-        for role in ["y", "treatment", "unit_id", "time"]:
-            if role not in self.mapping or not self.mapping[role]:
-                detected[role] = selection.get(role)
-
-        # Special columns
-        # log_propensity: look for columns with "propensity", "prob", "score"
-        if "log_propensity" not in self.mapping or not self.mapping["log_propensity"]:
-            propensity_candidates = [
-                col for col in self.df.columns
-                if any(kw in col.lower() for kw in ["propensity", "prob", "score", "ps"])
-            ]
-            if propensity_candidates:
-                detected["log_propensity"] = propensity_candidates[0]
-
-        # cost: look for "cost", "price", "expense"
-        if "cost" not in self.mapping or not self.mapping["cost"]:
-            cost_candidates = [
-                col for col in self.df.columns
-                if any(kw in col.lower() for kw in ["cost", "price", "expense", "spend"])
-            ]
-            if cost_candidates:
-                detected["cost"] = cost_candidates[0]
-
-        # domain: look for "domain", "site", "location"
-        if "domain" not in self.mapping or not self.mapping["domain"]:
-            domain_candidates = [
-                col for col in self.df.columns
-                if any(kw in col.lower() for kw in ["domain", "site", "location", "source"])
-            ]
-            if domain_candidates:
-                detected["domain"] = domain_candidates[0]
-
-        # cluster_id: look for "cluster", "group"
-        if "cluster_id" not in self.mapping or not self.mapping["cluster_id"]:
-            cluster_candidates = [
-                col for col in self.df.columns
-                if any(kw in col.lower() for kw in ["cluster", "group", "cohort"])
-                and col not in [detected.get("unit_id"), self.mapping.get("unit_id")]
-            ]
-            if cluster_candidates:
-                detected["cluster_id"] = cluster_candidates[0]
-
-        # z (instrument): look for "instrument", "z", "iv"
-        if "z" not in self.mapping or not self.mapping["z"]:
-            iv_candidates = [
-                col for col in self.df.columns
-                if any(kw in col.lower() for kw in ["instrument", "iv", "z"])
-                and col not in [self.mapping.get("treatment")]
-            ]
-            if iv_candidates:
-                detected["z"] = iv_candidates[0]
+        if any(role in needed for role in _STANDARD_ROLES):
+            from .column_selection import ColumnSelector
+
+            selector = ColumnSelector(self.df)
+            selection = selector.select_columns(confidence_threshold=0.2)
+            for role in _STANDARD_ROLES:
+                if role in needed:
+                    detected[role] = selection.get(role)
+
+        # Special columns: first column whose lowercased name matches the role pattern
+        lowered = [(col, str(col).lower()) for col in self.df.columns]
+
+        # cluster_id must not reuse the unit identifier; z must not reuse the treatment
+        exclusions = {
+            "cluster_id": (detected.get("unit_id"), self.mapping.get("unit_id")),
+            "z": (self.mapping.get("treatment"),),
+        }
+        for role, pattern in _ROLE_PATTERNS.items():
+            if role in needed:
+                exclude = exclusions.get(role, ())
+                match = next(
+                    (col for col, lc in lowered if pattern.search(lc) and col not in exclude),
+                    None
+                )
+                if match is not None:
+                    detected[role] = match
 
         return detected
 
@@ -267,7 +292,7 @@ class EstimatorValidator:
         # Current mapping
         lines.append("\nCurrent Mapping:")
         for role, col in self.mapping.items():
-            status = "✓" if col and col in self.available_columns else "✗"
+            status = "✓" if role in self._resolved_mapping else "✗"
             lines.append(f"  {status} {role:20} → {col or '(not set)'}")
 
         # Validation results
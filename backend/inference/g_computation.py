@@ -13,17 +13,13 @@ Reference: Robins (1986), "A new approach to causal inference in mortality studi
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-from scipy import stats
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.linear_model import Ridge
-from sklearn.model_selection import cross_val_predict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GComputationResult:
     """g-Computation evaluation result"""
     method: str  # "linear", "rf", "gbm"
@@ -35,6 +31,49 @@ class GComputationResult:
     r_squared: float  # Model fit quality
 
 
+class _ClosedFormRidge:
+    """
+    Ridge regression solved directly from the normal equations
+
+    Same estimator as sklearn's Ridge(alpha) with an unpenalized intercept, without
+    the input validation and solver dispatch; intended for dense X with few columns.
+    """
+
+    def __init__(self, alpha: float = 1.0):
+        self.alpha = alpha
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "_ClosedFormRidge":
+        x_mean = X.mean(axis=0)
+        y_mean = y.mean()
+        Xc = X - x_mean
+        A = Xc.T @ Xc
+        A[np.diag_indices_from(A)] += self.alpha
+        self.coef_ = np.linalg.solve(A, Xc.T @ (y - y_mean))
+        self.intercept_ = y_mean - x_mean @ self.coef_
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return X @ self.coef_ + self.intercept_
+
+
+def _cross_val_predict_ridge(
+    X: np.ndarray,
+    y: np.ndarray,
+    alpha: float,
+    n_folds: int = 5
+) -> np.ndarray:
+    """Out-of-fold ridge predictions on contiguous folds (same splits as cross_val_predict(cv=5))"""
+    n = len(y)
+    y_pred = np.empty(n, dtype=np.float64)
+    train = np.ones(n, dtype=bool)
+    for test_idx in np.array_split(np.arange(n), n_folds):
+        train[test_idx] = False
+        model = _ClosedFormRidge(alpha).fit(X[train], y[train])
+        y_pred[test_idx] = model.predict(X[test_idx])
+        train[test_idx] = True
+    return y_pred
+
+
 class GComputationEvaluator:
     """
     g-Computation Evaluator
@@ -60,31 +99,70 @@ class GComputationEvaluator:
             cost_col: Cost column (optional)
             value_per_y: Monetary value per outcome unit
         """
-        self.df = df.copy()
+        self.df = df  # read-only; derived quantities are kept as separate arrays
         self.treatment_col = treatment_col
         self.outcome_col = outcome_col
         self.cost_col = cost_col
         self.value_per_y = value_per_y
+        self.method: Optional[str] = None  # outcome model type, set by fit_outcome_model
 
         # Auto-detect features if not provided
         if feature_cols is None:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
+            # Same selection as select_dtypes(include=[np.number]), read straight off df.dtypes
             exclude = {treatment_col, outcome_col}
             if cost_col:
                 exclude.add(cost_col)
-            self.feature_cols = [c for c in numeric_cols if c not in exclude and not c.startswith("_")]
+            self.feature_cols = [
+                c for c, dtype in df.dtypes.items()
+                if issubclass(dtype.type, np.number) and c not in exclude and c[:1] != "_"
+            ]
         else:
             self.feature_cols = feature_cols
 
-        # Compute profit
+        # Design matrices [features | treatment], built once per dtype and reused by
+        # fit/predict. Only the treatment column is rewritten between calls.
+        self._X_cache: Dict[type, np.ndarray] = {}
+        self._dtype = np.float64
+        self._observed_treatment = np.nan_to_num(
+            df[treatment_col].to_numpy(dtype=np.float64, na_value=np.nan), nan=0.0
+        )
+
+        # Compute profit (kept in float64 regardless of the feature dtype)
+        self._profit = df[outcome_col].to_numpy(dtype=np.float64) * value_per_y
         if cost_col and cost_col in df.columns:
-            self.df["_profit"] = df[outcome_col] * value_per_y - df[cost_col]
+            self._profit -= df[cost_col].to_numpy(dtype=np.float64)
+
+    def _feature_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """Allocate an (n, k+1) design matrix with NaN-filled features in the first k columns"""
+        k = len(self.feature_cols)
+        X = np.empty((len(df), k + 1), dtype=self._dtype)
+        # Copy column by column straight into the buffer; df[feature_cols] would
+        # first materialize a sub-DataFrame and then a second array from it
+        for j, col in enumerate(self.feature_cols):
+            X[:, j] = df[col].to_numpy(dtype=self._dtype, na_value=np.nan)
+        features = X[:, :k]
+        features[np.isnan(features)] = 0.0
+        return X
+
+    def _design_matrix(
+        self,
+        df: pd.DataFrame,
+        treatment: Union[int, np.ndarray]
+    ) -> np.ndarray:
+        """Design matrix for df with the treatment column set to treatment"""
+        if df is self.df:
+            X = self._X_cache.get(self._dtype)
+            if X is None:
+                X = self._X_cache[self._dtype] = self._feature_matrix(df)
         else:
-            self.df["_profit"] = df[outcome_col] * value_per_y
+            X = self._feature_matrix(df)
+        X[:, -1] = treatment
+        return X
 
     def fit_outcome_model(
         self,
         method: str = "rf",
+        compute_r2: bool = True,
         **kwargs
     ) -> None:
         """
@@ -92,24 +170,33 @@ class GComputationEvaluator:
 
         Args:
             method: Model type - "linear", "rf", "gbm"
-            **kwargs: Model-specific parameters
+            compute_r2: Compute cross-validated R² (5 extra model fits); if
+                False, r_squared is set to NaN
+            **kwargs: Model-specific parameters; ``n_jobs`` (default -1, all
+                cores) caps parallelism of RF training and CV when running
+                inside a worker pool
         """
-        X = pd.concat([
-            self.df[self.feature_cols],
-            self.df[[self.treatment_col]]
-        ], axis=1).fillna(0)
-        y = self.df["_profit"].values
+        n_jobs = kwargs.get("n_jobs", -1)
+
+        # Tree ensembles split on float32 internally; feeding float32 avoids a
+        # float64 copy and halves memory traffic. The linear model keeps full precision.
+        self._dtype = np.float64 if method == "linear" else np.float32
+        X = self._design_matrix(self.df, self._observed_treatment)
+        y = self._profit
 
         if method == "linear":
-            self.model = Ridge(alpha=kwargs.get("alpha", 1.0))
+            self.model = _ClosedFormRidge(alpha=kwargs.get("alpha", 1.0))
         elif method == "rf":
+            from sklearn.ensemble import RandomForestRegressor
             self.model = RandomForestRegressor(
                 n_estimators=kwargs.get("n_estimators", 100),
                 max_depth=kwargs.get("max_depth", 10),
                 min_samples_leaf=kwargs.get("min_samples_leaf", 20),
-                random_state=kwargs.get("random_state", 42)
+                random_state=kwargs.get("random_state", 42),
+                n_jobs=n_jobs
             )
         elif method == "gbm":
+            from sklearn.ensemble import GradientBoostingRegressor
             self.model = GradientBoostingRegressor(
                 n_estimators=kwargs.get("n_estimators", 100),
                 max_depth=kwargs.get("max_depth", 5),
@@ -123,78 +210,92 @@ class GComputationEvaluator:
         self.method = method
 
         # Compute R² using cross-validation
-        y_pred_cv = cross_val_predict(self.model, X, y, cv=5)
-        self.r_squared = 1 - ((y - y_pred_cv) ** 2).sum() / ((y - y.mean()) ** 2).sum()
+        if compute_r2:
+            if method == "linear":
+                y_pred_cv = _cross_val_predict_ridge(X, y, self.model.alpha)
+            else:
+                from sklearn.model_selection import cross_val_predict
+                y_pred_cv = cross_val_predict(self.model, X, y, cv=5, n_jobs=n_jobs)
+            self.r_squared = 1 - ((y - y_pred_cv) ** 2).sum() / ((y - y.mean()) ** 2).sum()
+        else:
+            self.r_squared = np.nan
 
     def predict_counterfactual(
         self,
         df: pd.DataFrame,
-        treatment: int
+        treatment: Union[int, np.ndarray]
     ) -> np.ndarray:
         """
         Predict counterfactual outcomes E[Y|X,A=treatment]
 
         Args:
             df: Data to predict on
-            treatment: Treatment value (0 or 1)
+            treatment: Treatment value (0 or 1) applied to every row, or an
+                array with one treatment value per row of df
 
         Returns:
             Array of predicted outcomes
         """
-        X = pd.concat([
-            df[self.feature_cols],
-            pd.DataFrame({self.treatment_col: [treatment] * len(df)})
-        ], axis=1).fillna(0)
+        X = self._design_matrix(df, treatment)
 
         return self.model.predict(X)
 
+    def _prepare_outcome_model(self, method: Optional[str], refit: bool) -> None:
+        """Fit the outcome model, or check that the fitted one is the requested type"""
+        if refit:
+            self.fit_outcome_model(method=method or "rf")
+            return
+
+        if self.method is None:
+            raise ValueError("refit=False requires a prior fit_outcome_model call")
+        if method is not None and method != self.method:
+            raise ValueError(
+                f"method={method!r} does not match the fitted outcome model ({self.method!r}); "
+                "pass refit=True or method=None"
+            )
+
     def evaluate_policy(
         self,
         new_policy: np.ndarray,
-        method: str = "rf",
+        method: Optional[str] = None,
         n_bootstrap: int = 100,
-        alpha: float = 0.05
+        alpha: float = 0.05,
+        refit: bool = True
     ) -> GComputationResult:
         """
         Evaluate policy using g-computation
 
         Args:
             new_policy: New treatment assignments (0/1 array)
-            method: Model type
+            method: Model type ("rf" if None); with refit=False it must be
+                None or match the fitted model
             n_bootstrap: Number of bootstrap samples for CI
             alpha: Significance level
+            refit: Fit the outcome model first; pass False to reuse the model
+                from the last fit_outcome_model call
 
         Returns:
             GComputationResult
         """
         # Fit outcome model
-        self.fit_outcome_model(method=method)
+        self._prepare_outcome_model(method, refit)
 
-        # Predict counterfactual outcomes under new policy
-        y_cf = []
-        for i, treatment in enumerate(new_policy):
-            df_i = self.df.iloc[[i]]
-            y_cf.append(self.predict_counterfactual(df_i, treatment)[0])
-
-        y_cf = np.array(y_cf)
+        # Predict counterfactual outcomes under new policy (single batched predict)
+        y_cf = self.predict_counterfactual(self.df, np.asarray(new_policy))
         value = y_cf.mean()
 
-        # Bootstrap confidence interval
+        # Bootstrap confidence interval (all resamples drawn as one index matrix)
         n = len(y_cf)
-        bootstrap_values = []
-
-        rng = np.random.RandomState(42)
-        for _ in range(n_bootstrap):
-            idx = rng.choice(n, size=n, replace=True)
-            bootstrap_values.append(y_cf[idx].mean())
+        rng = np.random.default_rng(42)
+        idx_dtype = np.int32 if n <= np.iinfo(np.int32).max else np.int64
+        idx = rng.integers(0, n, size=(n_bootstrap, n), dtype=idx_dtype)
+        bootstrap_values = y_cf[idx].mean(axis=1)
 
-        bootstrap_values = np.array(bootstrap_values)
-        ci_lower = np.percentile(bootstrap_values, alpha / 2 * 100)
-        ci_upper = np.percentile(bootstrap_values, (1 - alpha / 2) * 100)
+        ci_lower, ci_upper = np.quantile(bootstrap_values, [alpha / 2, 1 - alpha / 2])
         std_error = bootstrap_values.std()
 
         return GComputationResult(
-            method=method,
+            method=self.method,
             value=value,
             std_error=std_error,
             ci_lower=ci_lower,
@@ -207,8 +308,9 @@ class GComputationEvaluator:
         self,
         coverage: float,
         score_col: Optional[str] = None,
-        method: str = "rf",
-        n_bootstrap: int = 100
+        method: Optional[str] = None,
+        n_bootstrap: int = 100,
+        refit: bool = True
     ) -> GComputationResult:
         """
         Evaluate policy with given coverage (top k%)
@@ -216,32 +318,41 @@ class GComputationEvaluator:
         Args:
             coverage: Coverage rate (0-1)
             score_col: Score column for ranking (if None, use predicted treatment effect)
-            method: Model type
+            method: Model type ("rf" if None); with refit=False it must be
+                None or match the fitted model
             n_bootstrap: Number of bootstrap samples
+            refit: Fit the outcome model first; pass False to reuse the model
+                from the last fit_outcome_model call
 
         Returns:
             GComputationResult
         """
         # Fit outcome model
-        self.fit_outcome_model(method=method)
+        self._prepare_outcome_model(method, refit)
 
         # Compute scores
         if score_col and score_col in self.df.columns:
-            scores = self.df[score_col].values
+            scores = self.df[score_col].to_numpy(copy=False)
         else:
             # Use predicted treatment effect: E[Y|X,A=1] - E[Y|X,A=0]
             y1 = self.predict_counterfactual(self.df, treatment=1)
             y0 = self.predict_counterfactual(self.df, treatment=0)
             scores = y1 - y0
 
-        # Top k% policy
-        k = int(len(scores) * coverage)
-        top_k_idx = np.argsort(scores)[-k:]
+        # Top k% policy (order within the top k is irrelevant, so partition instead of sort)
+        n = len(scores)
+        k = int(n * coverage)
+        if k <= 0:
+            top_k_idx = np.empty(0, dtype=np.intp)
+        elif k >= n:
+            top_k_idx = np.arange(n)
+        else:
+            top_k_idx = np.argpartition(scores, -k)[-k:]
 
-        new_policy = np.zeros(len(scores), dtype=int)
+        new_policy = np.zeros(n, dtype=np.int8)
         new_policy[top_k_idx] = 1
 
-        return self.evaluate_policy(new_policy, method=method, n_bootstrap=n_bootstrap)
+        return self.evaluate_policy(new_policy, n_bootstrap=n_bootstrap, refit=False)
 
     def compare_ope_gcomp(
         self,
@@ -339,19 +450,24 @@ def evaluate_scenario_gcomp(
     intervention = scenario_spec.get("intervention", {})
     coverage = intervention.get("coverage", 0.3)
 
+    # Fit once; scenario and baseline differ only in the policy vector
+    evaluator.fit_outcome_model(method=method)
+
     # Evaluate policy
     result = evaluator.evaluate_coverage(
         coverage=coverage,
         method=method,
-        n_bootstrap=n_bootstrap
+        n_bootstrap=n_bootstrap,
+        refit=False
     )
 
     # Compute baseline (observed policy value)
-    observed_policy = df[treatment_col].values
+    observed_policy = df[treatment_col].to_numpy(copy=False)
     baseline = evaluator.evaluate_policy(
         observed_policy,
         method=method,
-        n_bootstrap=n_bootstrap
+        n_bootstrap=n_bootstrap,
+        refit=False
     )
 
     return {
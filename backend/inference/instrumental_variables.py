@@ -33,13 +33,94 @@ import pandas as pd
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
 from scipy import stats
-from scipy.linalg import inv
-from sklearn.linear_model import LinearRegression, LassoCV
+from scipy.linalg import cho_factor, cho_solve, qr, solve
+from sklearn.linear_model import LinearRegression, Lasso, LassoCV
 from sklearn.ensemble import RandomForestRegressor
 import logging
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# DML-IV: rows used to choose the Lasso penalty before cross-fitting
+_LASSO_ALPHA_SUBSAMPLE = 5000
+
+
+if HAS_NUMBA:
+    @njit(parallel=True)
+    def _cluster_score_sums(W, residuals, order, bounds):
+        """
+        Per-cluster score sums s_g = Σ_{i in g} W_i e_i
+
+        Rows of cluster g are order[bounds[g]:bounds[g + 1]]; clusters are
+        processed in parallel and no (n, k) score matrix is formed.
+        """
+        G = bounds.shape[0] - 1
+        k = W.shape[1]
+        sums = np.zeros((G, k))
+        for g in prange(G):
+            for p in range(bounds[g], bounds[g + 1]):
+                i = order[p]
+                e = residuals[i]
+                for c in range(k):
+                    sums[g, c] += W[i, c] * e
+        return sums
+
+    @njit(fastmath=True)
+    def _dml_iv_moments(y_res, d_res):
+        """
+        Final DML-IV moment: ate = Σ ỹ d̃ / Σ d̃², V = Σ (ỹ - ate d̃)² d̃² / (Σ d̃²)²
+
+        Two fused passes over the cross-fit residuals, no temporaries.
+        """
+        s_yd = 0.0
+        s_dd = 0.0
+        for i in range(y_res.size):
+            s_yd += y_res[i] * d_res[i]
+            s_dd += d_res[i] * d_res[i]
+        ate = s_yd / s_dd
+
+        s_score = 0.0
+        for i in range(y_res.size):
+            score = (y_res[i] - ate * d_res[i]) * d_res[i]
+            s_score += score * score
+        return ate, s_score / (s_dd * s_dd)
+else:
+    def _cluster_score_sums(W, residuals, order, bounds):
+        """NumPy fallback: sort the scores by cluster and take segmented sums"""
+        scores = (W * residuals.reshape(-1, 1))[order]
+        return np.add.reduceat(scores, bounds[:-1], axis=0)
+
+    def _dml_iv_moments(y_res, d_res):
+        """NumPy fallback for the final DML-IV moment (see the numba version)"""
+        s_dd = d_res @ d_res
+        ate = (y_res @ d_res) / s_dd
+        score = (y_res - ate * d_res) * d_res
+        return ate, (score @ score) / (s_dd * s_dd)
+
+
+def _column_stack_f(blocks, n: int, intercept: bool = False) -> np.ndarray:
+    """
+    column_stack into a single Fortran-ordered buffer
+
+    LAPACK works column-major, so a Fortran-ordered design can be factored
+    in place instead of being copied on every call.
+    """
+    blocks = [np.asarray(b).reshape(n, -1) for b in blocks]
+    out = np.empty((n, int(intercept) + sum(b.shape[1] for b in blocks)), order='F')
+    j = 0
+    if intercept:
+        out[:, 0] = 1.0
+        j = 1
+    for b in blocks:
+        out[:, j:j + b.shape[1]] = b
+        j += b.shape[1]
+    return out
+
 
 @dataclass
 class IVResult:
@@ -93,36 +174,39 @@ class TwoStageLeastSquares:
         if Z.ndim == 1:
             Z = Z.reshape(-1, 1)
 
-        # Build design matrices
-        if X is not None:
-            X_mat = np.column_stack([np.ones(n), X])
-            Z_aug = np.column_stack([np.ones(n), X, Z])  # All exogenous + instruments
-        else:
-            X_mat = np.ones((n, 1))
-            Z_aug = np.column_stack([np.ones(n), Z])
+        # All exogenous variables + instruments, centered once. By
+        # Frisch–Waugh–Lovell, projecting on [1, X, Z] is the mean plus the
+        # projection on the centered [X, Z], so no column of ones is built
+        Z_centered = _column_stack_f([X, Z] if X is not None else [Z], n)
+        Z_centered -= Z_centered.mean(axis=0)
+
+        # Orthonormal basis of the centered instrument space, shared by the
+        # first-stage projection and the J-test (P_Z = 11'/n + Q Q').
+        # Z_centered is a private Fortran-ordered buffer, so QR runs in place
+        Q_z, _ = qr(Z_centered, mode='economic', overwrite_a=True, check_finite=False)
 
         # Stage 1: Regress treatment on all exogenous variables (X + Z)
-        treatment_hat, first_stage_stats = self._first_stage(treatment, Z_aug)
+        treatment_hat, first_stage_stats = self._first_stage(treatment, Q_z)
 
         # Stage 2: Regress y on treatment_hat + exogenous controls
-        if X is not None:
-            W = np.column_stack([treatment_hat, X])
-        else:
-            W = treatment_hat
+        W = _column_stack_f([treatment_hat, X] if X is not None else [treatment_hat], n)
 
-        beta_2sls = inv(W.T @ W) @ (W.T @ y)
+        # Normal equations via Cholesky; the factor is reused for the SEs
+        gram_factor = cho_factor(W.T @ W, lower=True, check_finite=False)
+        beta_2sls = cho_solve(gram_factor, W.T @ y, check_finite=False)
         ate = beta_2sls[0]
 
         # Standard errors
         residuals = y - W @ beta_2sls
 
         if cluster is not None:
-            se = self._clustered_se(W, residuals, cluster)[0]
+            se = self._clustered_se(W, residuals, cluster, gram_factor)[0]
         else:
-            # Homoskedastic SE
+            # Homoskedastic SE: only [(W'W)^-1]_00 is needed
             sigma2 = np.sum(residuals**2) / (n - W.shape[1])
-            V = sigma2 * inv(W.T @ W)
-            se = np.sqrt(V[0, 0])
+            e_0 = np.zeros(W.shape[1])
+            e_0[0] = 1.0
+            se = np.sqrt(sigma2 * cho_solve(gram_factor, e_0, check_finite=False)[0])
 
         # Confidence interval
         t_crit = stats.t.ppf(1 - self.alpha / 2, n - W.shape[1])
@@ -135,7 +219,7 @@ class TwoStageLeastSquares:
         overid_test_p = None
 
         if n_instruments > n_endogenous:
-            overid_test_p = self._hansen_j_test(y, treatment_hat, Z_aug, residuals)
+            overid_test_p = self._hansen_j_test(y, treatment_hat, Q_z, residuals)
 
         return IVResult(
             ate=float(ate),
@@ -153,18 +237,24 @@ class TwoStageLeastSquares:
             }
         )
 
-    def _first_stage(self, treatment: np.ndarray, Z_aug: np.ndarray) -> Tuple[np.ndarray, Dict]:
+    def _first_stage(self, treatment: np.ndarray, Q_z: np.ndarray) -> Tuple[np.ndarray, Dict]:
         """
         First stage regression with diagnostics
 
+        Args:
+            treatment: Endogenous treatment (n, 1)
+            Q_z: Thin-QR Q factor of the centered exogenous variables and
+                instruments (n, k - 1); the constant is handled by centering
+
         Returns:
             (treatment_hat, diagnostics)
         """
-        n, k = Z_aug.shape
+        n, k = Q_z.shape
+        k += 1  # Regressors including the constant
 
-        # Regression
-        beta_fs = inv(Z_aug.T @ Z_aug) @ (Z_aug.T @ treatment)
-        treatment_hat = Z_aug @ beta_fs
+        # Regression: fitted values are the mean plus the projection Q (Q' d)
+        # (Q is orthogonal to the constant, so Q' d = Q' (d - d̄))
+        treatment_hat = treatment.mean() + Q_z @ (Q_z.T @ treatment)
 
         # F-statistic
         residuals = treatment - treatment_hat
@@ -191,22 +281,36 @@ class TwoStageLeastSquares:
         self,
         W: np.ndarray,
         residuals: np.ndarray,
-        cluster: np.ndarray
+        cluster: np.ndarray,
+        gram_factor: Optional[Tuple[np.ndarray, bool]] = None
     ) -> np.ndarray:
-        """Cluster-robust standard errors"""
+        """
+        Cluster-robust standard errors
+
+        Args:
+            gram_factor: Cholesky factor of W'W from cho_factor, if already computed
+        """
         n, k = W.shape
-        unique_clusters = np.unique(cluster)
-        G = len(unique_clusters)
-
-        # Cluster-robust variance
-        meat = np.zeros((k, k))
-        for c in unique_clusters:
-            idx = cluster == c
-            W_c = W[idx]
-            e_c = residuals[idx]
-            meat += (W_c.T @ e_c).reshape(-1, 1) @ (W_c.T @ e_c).reshape(1, -1)
-
-        bread = inv(W.T @ W)
+        _, cluster_codes, cluster_sizes = np.unique(
+            cluster, return_inverse=True, return_counts=True
+        )
+        G = len(cluster_sizes)
+
+        # Cluster-robust variance: per-cluster score sums s_g = W_g' e_g from
+        # one sort by cluster, then meat = Σ_g s_g s_g'
+        order = np.argsort(cluster_codes, kind='stable')
+        bounds = np.concatenate(([0], np.cumsum(cluster_sizes)))
+        group_sums = _cluster_score_sums(
+            np.ascontiguousarray(W, dtype=np.float64),
+            np.ascontiguousarray(residuals, dtype=np.float64),
+            order,
+            bounds
+        )
+        meat = group_sums.T @ group_sums
+
+        if gram_factor is None:
+            gram_factor = cho_factor(W.T @ W, lower=True, check_finite=False)
+        bread = cho_solve(gram_factor, np.eye(k), check_finite=False)
         V_cluster = (G / (G - 1)) * (n - 1) / (n - k) * bread @ meat @ bread
 
         return np.sqrt(np.diag(V_cluster))
@@ -215,25 +319,30 @@ class TwoStageLeastSquares:
         self,
         y: np.ndarray,
         treatment_hat: np.ndarray,
-        Z_aug: np.ndarray,
+        Q_z: np.ndarray,
         residuals: np.ndarray
     ) -> float:
         """
         Hansen J-test for overidentifying restrictions
 
         H0: All instruments are valid
+
+        Args:
+            Q_z: Thin-QR Q factor of the centered exogenous variables and
+                instruments (n, k - 1)
         """
         n = len(y)
 
-        # Project residuals onto instruments
-        P_Z = Z_aug @ inv(Z_aug.T @ Z_aug) @ Z_aug.T
-        e_proj = P_Z @ residuals
+        # e' P_Z e = (Σe)²/n + ||Q' e||²: the constant's share plus the
+        # centered instruments' (orthogonal to it); P_Z itself is not formed
+        qtr = Q_z.T @ residuals
+        e_sum = residuals.sum()
 
         # J-statistic
-        J = n * (e_proj.T @ e_proj) / (residuals.T @ residuals)
+        J = n * (e_sum * e_sum / n + qtr @ qtr) / (residuals @ residuals)
 
         # Degrees of freedom = # overidentifying restrictions
-        df = Z_aug.shape[1] - 1  # Subtract # endogenous variables
+        df = Q_z.shape[1]  # k instruments incl. constant, minus # endogenous variables
 
         p_value = 1 - stats.chi2.cdf(J, df)
 
@@ -271,48 +380,66 @@ class GeneralizedMethodOfMoments:
         if Z.ndim == 1:
             Z = Z.reshape(-1, 1)
 
-        # Build instrument matrix
-        if X is not None:
-            Z_aug = np.column_stack([np.ones(n), X, Z])
-        else:
-            Z_aug = np.column_stack([np.ones(n), Z])
+        # Build instrument matrix (Fortran-ordered, filled column by column)
+        Z_aug = _column_stack_f([X, Z] if X is not None else [Z], n, intercept=True)
 
         k = Z_aug.shape[1]
 
-        # Step 1: 2SLS (identity weighting)
-        W_step1 = np.eye(k)
-        beta_step1 = self._gmm_step(y, treatment, Z_aug, W_step1, X)
-
-        # Compute residuals
         if X is not None:
-            X_mat = np.column_stack([treatment, X])
+            X_mat = _column_stack_f([treatment, X], n)
         else:
             X_mat = treatment
 
+        # Sample moments shared by both steps (the only n-sized products)
+        ZX = Z_aug.T @ X_mat
+        Zy = Z_aug.T @ y
+
+        # Step 1: 2SLS (identity weighting)
+        beta_step1 = self._gmm_step(ZX, Zy)
+
+        # Compute residuals
         residuals_step1 = y - X_mat @ beta_step1
 
-        # Step 2: Optimal weighting
+        # Step 2: Optimal weighting W = Omega^-1, applied through one Cholesky
+        # factor of Omega rather than an explicit inverse
         Omega = self._estimate_omega(Z_aug, residuals_step1)
-        W_step2 = inv(Omega)
-        beta_gmm = self._gmm_step(y, treatment, Z_aug, W_step2, X)
+        omega_factor = cho_factor(Omega, lower=True, check_finite=False)
+        beta_gmm = self._gmm_step(ZX, Zy, omega_factor)
         ate = beta_gmm[0]
 
         # Standard errors
         residuals = y - X_mat @ beta_gmm
 
-        # GMM variance
-        G = Z_aug.T @ X_mat / n  # Moment conditions
-        V_gmm = inv(G.T @ W_step2 @ G) / n
-        se = np.sqrt(V_gmm[0, 0])
+        # GMM variance. Only V[0, 0] is read, so partition G = [g_d | G_x]
+        # (treatment vs exogenous columns) and take the inverse of the Schur
+        # complement of G_x'WG_x in G'WG instead of solving the full system
+        G = ZX / n  # Moment conditions
+        WG = cho_solve(omega_factor, G, check_finite=False)
+        g_d, G_x = G[:, 0], G[:, 1:]
+        schur = g_d @ WG[:, 0]
+        if G_x.shape[1] > 0:
+            a12 = G_x.T @ WG[:, 0]
+            A22 = G_x.T @ WG[:, 1:]
+            schur -= a12 @ cho_solve(
+                cho_factor(A22, lower=True, check_finite=False), a12, check_finite=False
+            )
+        se = np.sqrt(1.0 / (n * schur))
 
         # Confidence interval
         z_crit = stats.norm.ppf(1 - self.alpha / 2)
         ci_lower = ate - z_crit * se
         ci_upper = ate + z_crit * se
 
-        # First stage F-stat (for diagnostics)
-        treatment_hat = Z_aug @ inv(Z_aug.T @ Z_aug) @ (Z_aug.T @ treatment)
-        R2 = 1 - np.sum((treatment - treatment_hat)**2) / np.sum((treatment - treatment.mean())**2)
+        # First stage F-stat (for diagnostics). Z'd is the treatment column of
+        # ZX, and SSR = d'd - (Z'd)'(Z'Z)^-1(Z'd), so the fitted treatment
+        # vector is never formed
+        d = treatment.ravel()
+        Ztd = ZX[:, 0]
+        fitted_ss = Ztd @ cho_solve(
+            cho_factor(Z_aug.T @ Z_aug, lower=True, check_finite=False), Ztd, check_finite=False
+        )
+        d_dev = d - d.mean()
+        R2 = 1 - (d @ d - fitted_ss) / (d_dev @ d_dev)
         f_stat = (R2 / (k - 1)) / ((1 - R2) / (n - k))
 
         # Hansen J-test
@@ -321,7 +448,7 @@ class GeneralizedMethodOfMoments:
             # Moment conditions
             g = Z_aug * residuals.reshape(-1, 1)
             g_bar = g.mean(axis=0)
-            J = n * g_bar.T @ W_step2 @ g_bar
+            J = n * g_bar @ cho_solve(omega_factor, g_bar, check_finite=False)
             df = k - 1
             overid_test_p = float(1 - stats.chi2.cdf(J, df))
 
@@ -344,25 +471,27 @@ class GeneralizedMethodOfMoments:
 
     def _gmm_step(
         self,
-        y: np.ndarray,
-        treatment: np.ndarray,
-        Z: np.ndarray,
-        W: np.ndarray,
-        X: Optional[np.ndarray]
+        ZX: np.ndarray,
+        Zy: np.ndarray,
+        omega_factor: Optional[Tuple[np.ndarray, bool]] = None
     ) -> np.ndarray:
-        """Single GMM step with weighting matrix W"""
-        n = len(y)
-
-        if X is not None:
-            X_mat = np.column_stack([treatment, X])
-        else:
-            X_mat = treatment
+        """
+        Single GMM step with weighting matrix W = Omega^-1
 
+        Args:
+            ZX: Z'X (k, p)
+            Zy: Z'y (k,)
+            omega_factor: cho_factor of Omega; identity weighting if None
+        """
         # GMM estimator: beta = (X'Z W Z'X)^{-1} X'Z W Z'y
-        ZX = Z.T @ X_mat
-        Zy = Z.T @ y
+        if omega_factor is None:
+            WZX = ZX
+        else:
+            WZX = cho_solve(omega_factor, ZX, check_finite=False)
 
-        beta = inv(ZX.T @ W @ ZX) @ (ZX.T @ W @ Zy)
+        # One LAPACK POSV call: ZX' W ZX is symmetric positive definite and
+        # its factor is not needed again
+        beta = solve(ZX.T @ WZX, WZX.T @ Zy, assume_a='pos', check_finite=False)
 
         return beta
 
@@ -375,8 +504,10 @@ class GeneralizedMethodOfMoments:
         """
         n = Z.shape[0]
 
-        # Heteroskedasticity-robust
-        Omega = Z.T @ (Z * residuals.reshape(-1, 1)**2) / n
+        # Heteroskedasticity-robust: Σ z_i z_i' e_i² = (Z ∘ e)'(Z ∘ e), one
+        # scaled copy of Z and a symmetric GEMM
+        Ze = Z * residuals.reshape(-1, 1)
+        Omega = (Ze.T @ Ze) / n
 
         return Omega
 
@@ -391,16 +522,24 @@ class DML_IV:
     - Orthogonal moments → valid inference
     """
 
-    def __init__(self, ml_model: str = "rf", n_folds: int = 5, alpha: float = 0.05):
+    def __init__(
+        self,
+        ml_model: str = "gradient_boosting",
+        n_folds: int = 5,
+        alpha: float = 0.05,
+        n_jobs: int = -1
+    ):
         """
         Args:
-            ml_model: "lasso", "rf", or "gradient_boosting"
+            ml_model: "lasso", "rf", or "gradient_boosting" (histogram-based)
             n_folds: Number of cross-fitting folds
             alpha: Significance level
+            n_jobs: Parallel workers for the cross-fitting folds (joblib convention)
         """
         self.ml_model = ml_model
         self.n_folds = n_folds
         self.alpha = alpha
+        self.n_jobs = n_jobs
 
     def estimate(
         self,
@@ -417,6 +556,7 @@ class DML_IV:
 
         where m(Z,X) = E[Y|Z,X], r(Z,X) = E[D|Z,X]
         """
+        from joblib import Parallel, delayed, effective_n_jobs
         from sklearn.model_selection import KFold
 
         n = len(y)
@@ -434,35 +574,33 @@ class DML_IV:
         y_res = np.zeros(n)
         d_res = np.zeros(n)
 
-        # Cross-fitting
+        # Cross-fitting: folds are independent, so fit them in parallel
+        # (joblib memory-maps large inputs for the worker processes)
         kf = KFold(n_splits=self.n_folds, shuffle=True, random_state=42)
 
-        for train_idx, test_idx in kf.split(W):
-            W_train, W_test = W[train_idx], W[test_idx]
-            y_train, y_test = y[train_idx], y[test_idx]
-            d_train, d_test = treatment[train_idx], treatment[test_idx]
-
-            # Fit nuisance functions
-            m_model = self._get_model()
-            r_model = self._get_model()
-
-            m_model.fit(W_train, y_train)
-            r_model.fit(W_train, d_train)
-
-            # Predict on test set
-            m_hat = m_model.predict(W_test)
-            r_hat = r_model.predict(W_test)
-
-            # Residuals
-            y_res[test_idx] = y_test - m_hat
-            d_res[test_idx] = d_test - r_hat
+        # Lasso penalties are chosen once per nuisance target, not per fold
+        if self.ml_model == "lasso":
+            alpha_m = self._select_lasso_alpha(W, y)
+            alpha_r = self._select_lasso_alpha(W, treatment)
+        else:
+            alpha_m = alpha_r = None
+
+        n_jobs = min(effective_n_jobs(self.n_jobs), self.n_folds)
+        fold_results = Parallel(n_jobs=n_jobs, prefer="processes")(
+            delayed(_fit_dml_iv_fold)(
+                self._get_model(alpha_m), self._get_model(alpha_r),
+                W, y, treatment, train_idx, test_idx
+            )
+            for train_idx, test_idx in kf.split(W)
+        )
 
-        # Final IV regression: y_res ~ d_res (OLS)
-        ate = np.sum(y_res * d_res) / np.sum(d_res**2)
+        for test_idx, y_res_fold, d_res_fold in fold_results:
+            y_res[test_idx] = y_res_fold
+            d_res[test_idx] = d_res_fold
 
-        # Standard error (heteroskedasticity-robust)
-        residuals = y_res - ate * d_res
-        V = np.sum(residuals**2 * d_res**2) / (np.sum(d_res**2)**2)
+        # Final IV regression: y_res ~ d_res (OLS), with the
+        # heteroskedasticity-robust variance from the same residuals
+        ate, V = _dml_iv_moments(y_res, d_res)
         se = np.sqrt(V / n)
 
         # Confidence interval
@@ -492,15 +630,63 @@ class DML_IV:
             }
         )
 
-    def _get_model(self):
-        """Get ML model instance"""
+    def _get_model(self, lasso_alpha: Optional[float] = None):
+        """
+        Get ML model instance
+
+        Args:
+            lasso_alpha: Pre-selected Lasso penalty (see _select_lasso_alpha)
+        """
         if self.ml_model == "lasso":
-            return LassoCV(cv=3, random_state=42)
+            if lasso_alpha is None:
+                return LassoCV(cv=3, random_state=42)
+            return Lasso(alpha=lasso_alpha, random_state=42)
         elif self.ml_model == "rf":
             return RandomForestRegressor(n_estimators=100, max_depth=5, random_state=42)
         else:
-            from sklearn.ensemble import GradientBoostingRegressor
-            return GradientBoostingRegressor(n_estimators=100, max_depth=3, random_state=42)
+            from sklearn.ensemble import HistGradientBoostingRegressor
+            return HistGradientBoostingRegressor(
+                max_iter=200, early_stopping=True, validation_fraction=0.1, random_state=42
+            )
+
+    def _select_lasso_alpha(self, W: np.ndarray, target: np.ndarray) -> float:
+        """Choose the Lasso penalty once with LassoCV on (a subsample of) the data"""
+        n = len(target)
+        if n > _LASSO_ALPHA_SUBSAMPLE:
+            idx = np.random.default_rng(42).choice(n, _LASSO_ALPHA_SUBSAMPLE, replace=False)
+            W, target = W[idx], target[idx]
+        return float(LassoCV(cv=3, random_state=42).fit(W, target).alpha_)
+
+
+def _fit_dml_iv_fold(
+    m_model,
+    r_model,
+    W: np.ndarray,
+    y: np.ndarray,
+    treatment: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fit the DML-IV nuisance models on one cross-fitting fold
+
+    Module-level so joblib can ship it to worker processes.
+
+    Returns:
+        (test_idx, outcome residuals, treatment residuals) on the held-out fold
+    """
+    W_train, W_test = W[train_idx], W[test_idx]
+
+    # Fit nuisance functions
+    m_model.fit(W_train, y[train_idx])
+    r_model.fit(W_train, treatment[train_idx])
+
+    # Residuals on the held-out fold
+    return (
+        test_idx,
+        y[test_idx] - m_model.predict(W_test),
+        treatment[test_idx] - r_model.predict(W_test)
+    )
 
 
 class InstrumentalVariablesAnalyzer:
@@ -1,6 +1,6 @@
 """Interrupted Time Series - 推定器#18"""
 import numpy as np
-from sklearn.linear_model import LinearRegression
+from scipy.linalg import lstsq
 
 def estimate_its(y: np.ndarray, time: np.ndarray, intervention_time: int) -> dict:
     """Interrupted Time Series分析
@@ -18,10 +18,10 @@ def estimate_its(y: np.ndarray, time: np.ndarray, intervention_time: int) -> dic
         time_after           # Slope change
     ])
     
-    model = LinearRegression(fit_intercept=False)
-    model.fit(X, y)
-    
-    coef = model.coef_
+    # Small 4-column OLS: pivoted QR (gelsy) is enough for a tall, thin design;
+    # X is local scratch, so LAPACK may overwrite it
+    coef, *_ = lstsq(X, y, lapack_driver='gelsy', check_finite=False,
+                     overwrite_a=True, overwrite_b=False)
     
     return {
         'level_change': float(coef[2]),      # Immediate effect
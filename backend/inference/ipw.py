@@ -1,5 +1,6 @@
 """Inverse Propensity Weighting - 推定器#13"""
 import numpy as np
+from scipy.special import expit
 from sklearn.linear_model import LogisticRegression
 
 def estimate_ate_ipw(X: np.ndarray, y: np.ndarray, treatment: np.ndarray, 
@@ -7,26 +8,36 @@ def estimate_ate_ipw(X: np.ndarray, y: np.ndarray, treatment: np.ndarray,
     """IPW ATE推定（trimming付き）"""
     ps_model = LogisticRegression(max_iter=1000)
     ps_model.fit(X, treatment)
-    ps = ps_model.predict_proba(X)[:, 1]
+    # Binary logit: P(T=1|X) is the sigmoid of the decision function
+    ps = expit(ps_model.decision_function(X))
     
     # Trimming
     ps = np.clip(ps, trim, 1-trim)
     
-    # IPW weights
-    w_treated = treatment / ps
-    w_control = (1 - treatment) / (1 - ps)
+    # Split the sample by arm once; each arm's weights and outcomes are then
+    # formed only over its own units instead of multiplying by 0/1 indicators
+    mask = treatment.astype(bool)
+    n = len(treatment)
+    n_treated = np.count_nonzero(mask)
     
     # Stabilized weights
     p_t = np.mean(treatment)
-    w_treated = w_treated * p_t
-    w_control = w_control * (1 - p_t)
+    w_treated = p_t / ps[mask]
+    w_control = (1 - p_t) / (1 - ps[~mask])
     
-    # ATE
-    ate = np.mean(w_treated * y) - np.mean(w_control * y)
+    # Weighted outcomes of each arm (the other arm contributes zeros)
+    contrib_treated = w_treated * y[mask]
+    contrib_control = w_control * y[~mask]
     
-    # Variance (conservative)
-    var_treated = np.var(w_treated * y * treatment) / np.sum(treatment)
-    var_control = np.var(w_control * y * (1-treatment)) / np.sum(1-treatment)
+    # ATE: arm sums over the full sample size
+    mean_treated = contrib_treated.sum() / n
+    mean_control = contrib_control.sum() / n
+    ate = mean_treated - mean_control
+    
+    # Variance (conservative): full-sample variance of each zero-padded
+    # contribution, E[c²] - E[c]², taken from the arm's own values
+    var_treated = (contrib_treated @ contrib_treated / n - mean_treated**2) / n_treated
+    var_control = (contrib_control @ contrib_control / n - mean_control**2) / (n - n_treated)
     se = np.sqrt(var_treated + var_control)
     
     return float(ate), float(se)
@@ -0,0 +1,41 @@
+# backend/inference/least_squares.py
+"""
+Least-Squares Helpers
+OLS with a Cholesky fast path and a rank-deficient fallback, shared by the
+regression-adjusted estimators
+"""
+from typing import Tuple
+
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, lstsq, pinvh, solve_triangular
+
+
+def ols_cholesky_or_lstsq(Z: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    OLS coefficients, diag((Z'Z)^-1) and the rank of the design Z
+
+    Full-rank designs use one Cholesky factorization Z'Z = R'R for both the
+    coefficients and diag(R^-1 R^-T). Rank-deficient designs (e.g. a constant
+    or duplicated covariate) fall back to the minimum-norm least-squares
+    solution and the pseudo-inverse of Z'Z; use the returned rank for the
+    residual degrees of freedom.
+
+    Returns:
+        (beta, gram_inv_diag, rank)
+    """
+    gram = Z.T @ Z
+    try:
+        R, _ = cho_factor(gram, lower=False, check_finite=False)
+        # Roundoff can leave an exactly collinear column with a tiny positive
+        # pivot instead of a failed factorization
+        if np.any(np.diag(R) ** 2 <= np.sqrt(np.finfo(float).eps) * np.diag(gram)):
+            raise LinAlgError("design matrix is rank-deficient")
+    except LinAlgError:
+        beta, _, rank, _ = lstsq(
+            Z, y, cond=max(Z.shape) * np.finfo(float).eps, check_finite=False
+        )
+        return beta, np.diag(pinvh(gram, check_finite=False)), int(rank)
+
+    beta = cho_solve((R, False), Z.T @ y, check_finite=False)
+    R_inv = solve_triangular(R, np.eye(R.shape[0]), check_finite=False)
+    return beta, np.einsum('ij,ij->i', R_inv, R_inv), Z.shape[1]
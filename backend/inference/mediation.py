@@ -1,6 +1,33 @@
 """Mediation Analysis - 推定器#16"""
 import numpy as np
-from sklearn.linear_model import LinearRegression
+
+
+def _mediation_paths(treatment: np.ndarray, mediator: np.ndarray, y: np.ndarray):
+    """a, b, c', c paths along the last axis (1-D sample or (B, n) replicates)"""
+    # Closed-form OLS with intercept: on centered data each slope comes from
+    # a handful of dot products (1×1 or 2×2 normal equations)
+    t_c = treatment - treatment.mean(axis=-1, keepdims=True)
+    m_c = mediator - mediator.mean(axis=-1, keepdims=True)
+    y_c = y - y.mean(axis=-1, keepdims=True)
+    S_tt = np.einsum('...i,...i->...', t_c, t_c)
+    S_tm = np.einsum('...i,...i->...', t_c, m_c)
+    S_mm = np.einsum('...i,...i->...', m_c, m_c)
+    S_ty = np.einsum('...i,...i->...', t_c, y_c)
+    S_my = np.einsum('...i,...i->...', m_c, y_c)
+
+    # Model 1: Treatment → Mediator (a path)
+    a = S_tm / S_tt
+
+    # Model 2: Treatment + Mediator → Outcome (b and c' paths)
+    det = S_tt * S_mm - S_tm * S_tm
+    c_prime = (S_mm * S_ty - S_tm * S_my) / det  # Direct effect
+    b = (S_tt * S_my - S_tm * S_ty) / det        # Mediator effect
+
+    # Model 3: Treatment → Outcome (c path, total effect)
+    c = S_ty / S_tt  # Total effect
+
+    return a, b, c_prime, c
+
 
 def estimate_mediation(X: np.ndarray, y: np.ndarray, treatment: np.ndarray, 
                       mediator: np.ndarray) -> dict:
@@ -9,19 +36,7 @@ def estimate_mediation(X: np.ndarray, y: np.ndarray, treatment: np.ndarray,
     Total Effect = Direct Effect + Indirect Effect
     Indirect Effect = a * b (treatment→mediator→outcome)
     """
-    # Model 1: Treatment → Mediator (a path)
-    model_a = LinearRegression().fit(treatment.reshape(-1, 1), mediator)
-    a = float(model_a.coef_[0])
-    
-    # Model 2: Treatment + Mediator → Outcome (b and c' paths)
-    X_full = np.column_stack([treatment, mediator])
-    model_bc = LinearRegression().fit(X_full, y)
-    c_prime = float(model_bc.coef_[0])  # Direct effect
-    b = float(model_bc.coef_[1])        # Mediator effect
-    
-    # Model 3: Treatment → Outcome (c path, total effect)
-    model_c = LinearRegression().fit(treatment.reshape(-1, 1), y)
-    c = float(model_c.coef_[0])  # Total effect
+    a, b, c_prime, c = (float(v) for v in _mediation_paths(treatment, mediator, y))
     
     # Indirect effect
     indirect = a * b
@@ -38,3 +53,31 @@ def estimate_mediation(X: np.ndarray, y: np.ndarray, treatment: np.ndarray,
         'b_path': b
     }
 
+
+def estimate_mediation_batched(indices: np.ndarray, treatment: np.ndarray,
+                               mediator: np.ndarray, y: np.ndarray) -> dict:
+    """Bootstrap版 Mediation Analysis
+
+    indices: (B, n) resample indices. Each key holds a length-B array with
+    the estimate_mediation result for the corresponding replicate.
+    """
+    indices = np.asarray(indices)
+    treatment = np.asarray(treatment, dtype=np.float64)
+    mediator = np.asarray(mediator, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Gather all replicates as (B, n) blocks so every path is a row-wise reduction
+    a, b, c_prime, c = _mediation_paths(treatment[indices], mediator[indices], y[indices])
+    indirect = a * b
+    nonzero = c != 0
+    prop_mediated = np.divide(indirect, c, out=np.zeros_like(indirect), where=nonzero)
+
+    return {
+        'total_effect': c,
+        'direct_effect': c_prime,
+        'indirect_effect': indirect,
+        'prop_mediated': prop_mediated,
+        'a_path': a,
+        'b_path': b
+    }
+
@@ -36,11 +36,157 @@ import pandas as pd
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
 from scipy import stats
-from sklearn.linear_model import LinearRegression
+import scipy.sparse as sp
 import logging
 
+from backend.inference.content_cache import LRUCache, array_digest, pandas_digest
+from backend.inference.least_squares import ols_cholesky_or_lstsq
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# Adjacency built by evaluate_network_effects_from_df, keyed by the content of
+# the network definition (LRU, most recent last)
+_ADJACENCY_CACHE_MAXSIZE = 8
+_adjacency_cache = LRUCache(maxsize=_ADJACENCY_CACHE_MAXSIZE)
+
+
+def _as_csr(adjacency_matrix) -> sp.csr_matrix:
+    """Adjacency as CSR (dense arrays and any scipy.sparse format accepted)
+
+    The stored dtype is kept: only the sparsity pattern and the sign of the
+    entries are read, so 0/1 networks can stay int8.
+    """
+    if sp.issparse(adjacency_matrix):
+        return sp.csr_matrix(adjacency_matrix)
+    return sp.csr_matrix(np.asarray(adjacency_matrix))
+
+
+def _compute_neighbor_treatment(
+    treatment: np.ndarray,
+    adjacency_matrix
+) -> np.ndarray:
+    """
+    Compute fraction of treated neighbors for each unit
+
+    Runs in float32: degrees and treated-neighbor counts are small integers
+    (exact in float32), and halving the bytes speeds up the memory-bound
+    SpMV/gemv.
+
+    Returns: float32 array of shape (n,) with values in [0, 1]
+    """
+    treatment = np.asarray(treatment, dtype=np.float32)
+
+    if sp.issparse(adjacency_matrix):
+        # Neighbors are the positive entries; with the 0/1 pattern the
+        # row-wise neighbor mean is one SpMV over the stored edges only
+        A = sp.csr_matrix(adjacency_matrix)
+        pattern = sp.csr_matrix(
+            ((A.data > 0).astype(np.float32), A.indices, A.indptr), shape=A.shape
+        )
+        deg = np.asarray(pattern.sum(axis=1)).ravel()
+        sum_t = pattern @ treatment
+        return np.divide(sum_t, deg, out=np.zeros_like(sum_t), where=deg > 0)
+
+    # Dense input: the same neighbor mean as one gemv over the 0/1 pattern
+    pattern = (np.asarray(adjacency_matrix) > 0).astype(np.float32)
+    deg = pattern.sum(axis=1)
+    sum_t = pattern @ treatment
+    return np.divide(sum_t, deg, out=np.zeros_like(sum_t), where=deg > 0)
+
+
+if HAS_NUMBA:
+    @njit
+    def _exposure_buckets(y, treatment, neighbor_treatment, treatment_probs, exposure):
+        """
+        Exposure code plus per-exposure weighted sums in one sweep
+
+        Codes: 0 = none, 1 = direct only, 2 = spillover only, 3 = both
+        (units whose treatment is neither 0 nor 1 stay in bucket 0).
+        Writes the codes into `exposure` and returns (Σ w y, Σ w, count, M2)
+        per bucket with the simplified HT weight w = 1 / (p + 0.01); M2 is
+        the unweighted sum of squared deviations of y (Welford update).
+        """
+        sums = np.zeros(4)
+        wsums = np.zeros(4)
+        counts = np.zeros(4, np.int64)
+        means = np.zeros(4)
+        M2 = np.zeros(4)
+        for i in range(y.shape[0]):
+            spill = 2 if neighbor_treatment[i] > 0 else 0
+            if treatment[i] == 1:
+                e = 1 + spill
+            elif treatment[i] == 0:
+                e = spill
+            else:
+                e = 0
+            exposure[i] = e
+            w = 1.0 / (treatment_probs[i] + 0.01)
+            sums[e] += w * y[i]
+            wsums[e] += w
+            counts[e] += 1
+            delta = y[i] - means[e]
+            means[e] += delta / counts[e]
+            M2[e] += delta * (y[i] - means[e])
+        return sums, wsums, counts, M2
+else:
+    def _exposure_buckets(y, treatment, neighbor_treatment, treatment_probs, exposure):
+        """NumPy fallback for the exposure bucketing (see the numba version)"""
+        # Code = own treatment bit | (treated neighbors bit << 1)
+        np.bitwise_or(
+            (treatment == 1).astype(np.uint8),
+            (neighbor_treatment > 0).astype(np.uint8) << 1,
+            out=exposure
+        )
+        exposure[(treatment != 0) & (treatment != 1)] = 0
+
+        # Per-exposure weighted sums as scatter-adds over the codes
+        w = 1.0 / (treatment_probs + 0.01)
+        sums = np.bincount(exposure, weights=w * y, minlength=4)
+        wsums = np.bincount(exposure, weights=w, minlength=4)
+        counts = np.bincount(exposure, minlength=4)
+
+        # M2 = Σ y² - (Σ y)² / n per exposure, on y shifted by its overall
+        # mean to limit cancellation
+        y_c = y - y.mean()
+        sum_y = np.bincount(exposure, weights=y_c, minlength=4)
+        sum_y2 = np.bincount(exposure, weights=y_c * y_c, minlength=4)
+        M2 = np.maximum(sum_y2 - sum_y * sum_y / np.maximum(counts, 1), 0.0)
+        return sums, wsums, counts, M2
+
+
+def _ht_bootstrap_replicates(
+    y: np.ndarray,
+    exposure: np.ndarray,
+    weights: np.ndarray,
+    seeds: List[np.random.SeedSequence]
+) -> np.ndarray:
+    """
+    (direct, spillover) HT effects on unit-level bootstrap resamples, one
+    per seed
+
+    Exposures are fixed by the observed network and assignment, so each
+    replicate is one resample plus two bincounts. Module-level so joblib
+    can ship it to worker processes.
+    """
+    n = y.shape[0]
+    wy = weights * y
+    effects = np.empty((len(seeds), 2))
+    for r, seed in enumerate(seeds):
+        idx = np.random.default_rng(seed).integers(0, n, n)
+        e = exposure[idx]
+        sums = np.bincount(e, weights=wy[idx], minlength=4)
+        wsums = np.bincount(e, weights=weights[idx], minlength=4)
+        means = np.divide(sums, wsums, out=np.zeros(4), where=wsums > 0)
+        effects[r, 0] = means[1] - means[0]
+        effects[r, 1] = means[3] - means[1]
+    return effects
+
 
 @dataclass
 class NetworkResult:
@@ -62,15 +208,35 @@ class HorvitzThompson:
     then use IPW to estimate effects.
     """
 
-    def __init__(self, alpha: float = 0.05):
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        se_method: str = "analytical",
+        n_bootstrap: int = 500,
+        n_jobs: int = -1,
+        random_state: int = 42
+    ):
+        """
+        Args:
+            alpha: Significance level
+            se_method: "analytical" (within-group variance) or "bootstrap"
+            n_bootstrap: Bootstrap replicates when se_method="bootstrap"
+            n_jobs: Parallel workers for the bootstrap (joblib convention)
+            random_state: Seed for the bootstrap resamples
+        """
         self.alpha = alpha
+        self.se_method = se_method
+        self.n_bootstrap = n_bootstrap
+        self.n_jobs = n_jobs
+        self.random_state = random_state
 
     def estimate(
         self,
         y: np.ndarray,
         treatment: np.ndarray,
-        adjacency_matrix: np.ndarray,  # (n, n) - 1 if connected
-        treatment_probs: Optional[np.ndarray] = None  # P(D_i = 1)
+        adjacency_matrix,  # (n, n) ndarray or scipy.sparse - 1 if connected
+        treatment_probs: Optional[np.ndarray] = None,  # P(D_i = 1)
+        neighbor_treatment: Optional[np.ndarray] = None
     ) -> NetworkResult:
         """
         Estimate network effects using Horvitz-Thompson
@@ -78,61 +244,64 @@ class HorvitzThompson:
         Args:
             y: Outcomes (n,)
             treatment: Treatment indicators (n,)
-            adjacency_matrix: Network adjacency (n, n)
+            adjacency_matrix: Network adjacency (n, n), dense or scipy.sparse
             treatment_probs: Treatment assignment probabilities
+            neighbor_treatment: Precomputed fraction of treated neighbors (n,)
 
         Returns:
             NetworkResult
         """
         n = len(y)
+        A = _as_csr(adjacency_matrix)
 
         # Compute exposure: (own treatment, fraction of treated neighbors)
-        neighbor_treatment = self._compute_neighbor_treatment(treatment, adjacency_matrix)
-
-        # Define exposure types
-        # Simplification: 4 exposure types
-        # (own=0, neighbors=0), (own=1, neighbors=0), (own=0, neighbors>0), (own=1, neighbors>0)
-
-        exposure = np.zeros(n, dtype=int)
-        exposure[(treatment == 0) & (neighbor_treatment == 0)] = 0  # No exposure
-        exposure[(treatment == 1) & (neighbor_treatment == 0)] = 1  # Direct only
-        exposure[(treatment == 0) & (neighbor_treatment > 0)] = 2  # Spillover only
-        exposure[(treatment == 1) & (neighbor_treatment > 0)] = 3  # Direct + spillover
+        if neighbor_treatment is None:
+            neighbor_treatment = _compute_neighbor_treatment(treatment, A)
 
         # If treatment probs not provided, assume uniform randomization
         if treatment_probs is None:
             p_treat = treatment.mean()
             treatment_probs = np.full(n, p_treat)
 
+        # Define exposure types
+        # Simplification: 4 exposure types
+        # (own=0, neighbors=0), (own=1, neighbors=0), (own=0, neighbors>0), (own=1, neighbors>0)
+        #
         # Horvitz-Thompson weights
         # For simplicity: weight = 1 / P(exposure_i)
         # Proper implementation requires joint assignment probabilities
+        #
+        # Exposure codes and the per-exposure weighted sums come from one pass
+        exposure = np.empty(n, dtype=np.uint8)
+        sums, wsums, counts, M2 = _exposure_buckets(
+            np.asarray(y, dtype=np.float64),
+            np.asarray(treatment, dtype=np.float64),
+            np.asarray(neighbor_treatment, dtype=np.float64),
+            np.asarray(treatment_probs, dtype=np.float64),
+            exposure
+        )
 
-        # Estimate potential outcomes under each exposure
-        y_means = {}
-        for exp in range(4):
-            mask = exposure == exp
-            if mask.sum() > 0:
-                # IPW estimate
-                weights = 1.0 / (treatment_probs[mask] + 0.01)  # Simplified
-                y_means[exp] = np.average(y[mask], weights=weights)
-            else:
-                y_means[exp] = 0.0
+        # Estimate potential outcomes under each exposure (IPW estimate)
+        # (empty exposures contribute 0)
+        y_means = np.divide(sums, wsums, out=np.zeros(4), where=counts > 0)
 
         # Direct effect: compare (1,0) vs (0,0)
-        direct_effect = y_means.get(1, 0) - y_means.get(0, 0)
+        direct_effect = y_means[1] - y_means[0]
 
         # Spillover effect: compare (0,1) vs (0,0)  [neighbors treated vs not]
         # Approximation: (1,1) - (1,0)
-        spillover_effect = y_means.get(3, 0) - y_means.get(1, 0)
+        spillover_effect = y_means[3] - y_means[1]
 
         # Total effect: compare (1,1) vs (0,0)
-        total_effect = y_means.get(3, 0) - y_means.get(0, 0)
+        total_effect = y_means[3] - y_means[0]
 
         # Standard errors (bootstrap-based or analytical)
-        # Simplified: use within-group variance
-        direct_se = self._compute_se_for_exposure_diff(y, exposure, 1, 0)
-        spillover_se = self._compute_se_for_exposure_diff(y, exposure, 3, 1)
+        if self.se_method == "bootstrap":
+            direct_se, spillover_se = self._bootstrap_se(y, exposure, treatment_probs)
+        else:
+            # Simplified: use within-group variance (from the same bucketing pass)
+            direct_se = self._compute_se_for_exposure_diff(M2, counts, 1, 0)
+            spillover_se = self._compute_se_for_exposure_diff(M2, counts, 3, 1)
 
         return NetworkResult(
             direct_effect=float(direct_effect),
@@ -143,52 +312,63 @@ class HorvitzThompson:
             method="horvitz_thompson",
             diagnostics={
                 "n": n,
-                "n_edges": int(adjacency_matrix.sum()),
-                "avg_degree": float(adjacency_matrix.sum(axis=1).mean()),
-                "exposure_counts": {int(k): int((exposure == k).sum()) for k in range(4)}
+                "n_edges": int(A.nnz),
+                "avg_degree": float(A.nnz / n),
+                "exposure_counts": {int(k): int(counts[k]) for k in range(4)}
             }
         )
 
-    def _compute_neighbor_treatment(
+    def _bootstrap_se(
         self,
-        treatment: np.ndarray,
-        adjacency_matrix: np.ndarray
-    ) -> np.ndarray:
+        y: np.ndarray,
+        exposure: np.ndarray,
+        treatment_probs: np.ndarray
+    ) -> Tuple[float, float]:
         """
-        Compute fraction of treated neighbors for each unit
+        Bootstrap SEs of the direct and spillover effects
 
-        Returns: array of shape (n,) with values in [0, 1]
+        Every replicate draws from its own seed stream spawned from
+        random_state, so the SEs do not depend on n_jobs; the replicates are
+        split into one chunk per worker and run in parallel.
         """
-        n = len(treatment)
-        neighbor_treatment = np.zeros(n)
+        from joblib import Parallel, delayed, effective_n_jobs
 
-        for i in range(n):
-            neighbors = adjacency_matrix[i] > 0
-            n_neighbors = neighbors.sum()
+        y = np.asarray(y, dtype=np.float64)
+        weights = 1.0 / (np.asarray(treatment_probs, dtype=np.float64) + 0.01)
 
-            if n_neighbors > 0:
-                neighbor_treatment[i] = treatment[neighbors].mean()
+        n_workers = max(1, min(effective_n_jobs(self.n_jobs), self.n_bootstrap))
+        bounds = np.linspace(0, self.n_bootstrap, n_workers + 1).astype(int)
+        seeds = np.random.SeedSequence(self.random_state).spawn(self.n_bootstrap)
 
-        return neighbor_treatment
+        chunks = Parallel(n_jobs=n_workers, prefer="processes")(
+            delayed(_ht_bootstrap_replicates)(y, exposure, weights, seeds[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        )
+        effects = np.vstack(chunks)
+        direct_se, spillover_se = effects.std(axis=0, ddof=1)
+
+        return float(direct_se), float(spillover_se)
 
     def _compute_se_for_exposure_diff(
         self,
-        y: np.ndarray,
-        exposure: np.ndarray,
+        M2: np.ndarray,
+        counts: np.ndarray,
         exp1: int,
         exp2: int
     ) -> float:
-        """Compute SE for difference between two exposure groups"""
-        mask1 = exposure == exp1
-        mask2 = exposure == exp2
+        """Compute SE for difference between two exposure groups
 
-        if mask1.sum() < 2 or mask2.sum() < 2:
+        M2 and counts are the per-exposure sums of squared deviations and
+        group sizes from _exposure_buckets.
+        """
+        n1 = counts[exp1]
+        n2 = counts[exp2]
+
+        if n1 < 2 or n2 < 2:
             return 1.0  # Default
 
-        var1 = y[mask1].var()
-        var2 = y[mask2].var()
-        n1 = mask1.sum()
-        n2 = mask2.sum()
+        var1 = M2[exp1] / n1
+        var2 = M2[exp2] / n2
 
         se = np.sqrt(var1 / n1 + var2 / n2)
 
@@ -211,8 +391,9 @@ class LinearInMeans:
         self,
         y: np.ndarray,
         treatment: np.ndarray,
-        adjacency_matrix: np.ndarray,
-        X: Optional[np.ndarray] = None
+        adjacency_matrix,
+        X: Optional[np.ndarray] = None,
+        neighbor_treatment: Optional[np.ndarray] = None
     ) -> NetworkResult:
         """
         Estimate network effects using linear-in-means model
@@ -220,39 +401,45 @@ class LinearInMeans:
         Args:
             y: Outcomes (n,)
             treatment: Treatment (n,)
-            adjacency_matrix: Adjacency matrix (n, n)
+            adjacency_matrix: Adjacency matrix (n, n), dense or scipy.sparse
             X: Covariates (n, p)
+            neighbor_treatment: Precomputed fraction of treated neighbors (n,)
 
         Returns:
             NetworkResult
         """
         n = len(y)
+        A = _as_csr(adjacency_matrix)
 
         # Compute neighbor treatment average
-        ht_estimator = HorvitzThompson()
-        neighbor_treatment = ht_estimator._compute_neighbor_treatment(treatment, adjacency_matrix)
+        if neighbor_treatment is None:
+            neighbor_treatment = _compute_neighbor_treatment(treatment, A)
 
-        # Regression: Y ~ D + D_neighbors + X
+        # Regression: Y ~ 1 + D + D_neighbors + X
         if X is not None:
-            design_matrix = np.column_stack([treatment, neighbor_treatment, X])
+            design_matrix = np.column_stack([np.ones(n), treatment, neighbor_treatment, X])
         else:
-            design_matrix = np.column_stack([treatment, neighbor_treatment])
+            design_matrix = np.column_stack([np.ones(n), treatment, neighbor_treatment])
 
-        model = LinearRegression()
-        model.fit(design_matrix, y)
+        # OLS via one Cholesky factorization of X'X (lstsq/pinvh fallback for
+        # rank-deficient covariates)
+        beta, gram_inv_diag, rank = ols_cholesky_or_lstsq(design_matrix, y)
 
         # Extract coefficients
-        direct_effect = model.coef_[0]
-        spillover_effect = model.coef_[1]
+        direct_effect = beta[1]
+        spillover_effect = beta[2]
         total_effect = direct_effect + spillover_effect
 
         # Standard errors
-        residuals = y - model.predict(design_matrix)
-        sigma2 = np.sum(residuals**2) / (n - design_matrix.shape[1])
-        V = sigma2 * np.linalg.inv(design_matrix.T @ design_matrix)
+        residuals = y - design_matrix @ beta
+        rss = residuals @ residuals
+        sigma2 = rss / (n - rank)
+        var_diag = sigma2 * gram_inv_diag
 
-        direct_se = np.sqrt(V[0, 0])
-        spillover_se = np.sqrt(V[1, 1])
+        direct_se = np.sqrt(var_diag[1])
+        spillover_se = np.sqrt(var_diag[2])
+
+        y_dev = y - y.mean()
 
         return NetworkResult(
             direct_effect=float(direct_effect),
@@ -263,9 +450,9 @@ class LinearInMeans:
             method="linear_in_means",
             diagnostics={
                 "n": n,
-                "r2": float(model.score(design_matrix, y)),
-                "n_edges": int(adjacency_matrix.sum()),
-                "avg_degree": float(adjacency_matrix.sum(axis=1).mean())
+                "r2": float(1 - rss / (y_dev @ y_dev)),
+                "n_edges": int(A.nnz),
+                "avg_degree": float(A.nnz / n)
             }
         )
 
@@ -282,7 +469,7 @@ class NetworkAnalyzer:
         self,
         y: np.ndarray,
         treatment: np.ndarray,
-        adjacency_matrix: np.ndarray,
+        adjacency_matrix,
         X: Optional[np.ndarray] = None,
         method: str = "linear_in_means",
         treatment_probs: Optional[np.ndarray] = None
@@ -293,7 +480,7 @@ class NetworkAnalyzer:
         Args:
             y: Outcomes
             treatment: Treatment
-            adjacency_matrix: Network structure (n, n)
+            adjacency_matrix: Network structure (n, n), dense or scipy.sparse
             X: Covariates
             method: "horvitz_thompson" or "linear_in_means"
             treatment_probs: Treatment assignment probabilities (for HT)
@@ -301,18 +488,25 @@ class NetworkAnalyzer:
         Returns:
             NetworkResult
         """
-        if method == "horvitz_thompson":
-            return self.ht.estimate(y, treatment, adjacency_matrix, treatment_probs)
-        elif method == "linear_in_means":
-            return self.lim.estimate(y, treatment, adjacency_matrix, X)
-        else:
+        if method not in ("horvitz_thompson", "linear_in_means"):
             raise ValueError(f"Unknown method: {method}")
 
+        # Normalize the adjacency and derive the exposure once; both
+        # estimators take them as given
+        A = _as_csr(adjacency_matrix)
+        neighbor_treatment = _compute_neighbor_treatment(treatment, A)
+
+        if method == "horvitz_thompson":
+            return self.ht.estimate(
+                y, treatment, A, treatment_probs, neighbor_treatment=neighbor_treatment
+            )
+        return self.lim.estimate(y, treatment, A, X, neighbor_treatment=neighbor_treatment)
+
     def construct_adjacency_from_distance(
         self,
         coordinates: np.ndarray,  # (n, 2) - lat/lon or x/y
         threshold: float
-    ) -> np.ndarray:
+    ) -> sp.csr_matrix:
         """
         Construct adjacency matrix from spatial coordinates
 
@@ -321,14 +515,28 @@ class NetworkAnalyzer:
             threshold: Distance threshold for connection
 
         Returns:
-            Adjacency matrix (n, n)
+            Sparse 0/1 adjacency matrix (n, n), int8 CSR. The estimators take
+            it as is; use .toarray() where a dense matrix is required.
         """
-        from scipy.spatial.distance import cdist
+        from scipy.spatial import cKDTree
+
+        # Only pairs within the threshold are visited, and each unordered
+        # pair once (i < j, no self-pairs); the symmetric half is mirrored
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        tree = cKDTree(coordinates)
+        pairs = tree.query_pairs(threshold, output_type="ndarray")
+        i, j = pairs[:, 0], pairs[:, 1]
 
-        distances = cdist(coordinates, coordinates)
-        adjacency = (distances < threshold) & (distances > 0)  # Exclude self-loops
+        # query_pairs is inclusive; keep the strict bound and drop coincident points
+        d = np.sqrt(((coordinates[i] - coordinates[j]) ** 2).sum(axis=1))
+        keep = (d < threshold) & (d > 0)
+        i, j = i[keep], j[keep]
+        n = tree.n
 
-        return adjacency.astype(int)
+        return sp.coo_matrix(
+            (np.ones(2 * len(i), dtype=np.int8), (np.concatenate([i, j]), np.concatenate([j, i]))),
+            shape=(n, n)
+        ).tocsr()
 
 
 # ==========================================
@@ -365,21 +573,38 @@ def evaluate_network_effects_from_df(
     Returns:
         Dictionary with DE/IE/TE results in quality gates format
     """
-    # Construct adjacency matrix
+    # Construct adjacency matrix (reused across calls on the same network)
     n = len(df)
+    analyzer = NetworkAnalyzer()
 
     if edges is not None:
         # Build from edge list
-        adjacency_matrix = _build_adjacency_from_edges(df, edges)
+        unit_ids = df["unit_id"].values if "unit_id" in df.columns else df.index.values
+        # Only the endpoint columns define the network (hash_pandas_object
+        # ignores column names, so they are selected explicitly); without
+        # them the builder returns an edgeless graph
+        if "src" in edges.columns and "dst" in edges.columns:
+            edges_digest = pandas_digest(edges[["src", "dst"]])
+        else:
+            edges_digest = "no_endpoints"
+        key = ("edges", pandas_digest(pd.Index(unit_ids)), edges_digest)
+        adjacency_matrix = _adjacency_cache.get_or_build(
+            key, lambda: _build_adjacency_from_edges(df, edges)
+        )
     elif coordinates is not None:
         # Build from spatial coordinates
         lat_col, lon_col = coordinates
         coords = df[[lat_col, lon_col]].values
-        analyzer = NetworkAnalyzer()
-        adjacency_matrix = analyzer.construct_adjacency_from_distance(coords, distance_threshold)
+        key = ("coordinates", array_digest(coords), float(distance_threshold))
+        adjacency_matrix = _adjacency_cache.get_or_build(
+            key, lambda: analyzer.construct_adjacency_from_distance(coords, distance_threshold)
+        )
     elif cluster_col is not None:
         # Build from cluster membership (within-cluster connections)
-        adjacency_matrix = _build_adjacency_from_clusters(df, cluster_col)
+        key = ("clusters", pandas_digest(df[cluster_col]))
+        adjacency_matrix = _adjacency_cache.get_or_build(
+            key, lambda: _build_adjacency_from_clusters(df, cluster_col)
+        )
     else:
         raise ValueError("Must provide either edges, coordinates, or cluster_col")
 
@@ -398,7 +623,6 @@ def evaluate_network_effects_from_df(
     X = df[X_cols].values if X_cols else None
 
     # Estimate network effects
-    analyzer = NetworkAnalyzer()
     result = analyzer.estimate(
         y=profit,
         treatment=treatment,
@@ -407,6 +631,9 @@ def evaluate_network_effects_from_df(
         method=method
     )
 
+    # Total-effect SE (direct and spillover SEs combined in quadrature)
+    total_se = float(np.hypot(result.direct_se, result.spillover_se))
+
     # Format results for quality gates integration
     return {
         "direct_effect": {
@@ -427,10 +654,10 @@ def evaluate_network_effects_from_df(
         },
         "total_effect": {
             "value": result.total_effect,
-            "std_error": np.sqrt(result.direct_se**2 + result.spillover_se**2),
+            "std_error": total_se,
             "ci": [
-                result.total_effect - 1.96 * np.sqrt(result.direct_se**2 + result.spillover_se**2),
-                result.total_effect + 1.96 * np.sqrt(result.direct_se**2 + result.spillover_se**2)
+                result.total_effect - 1.96 * total_se,
+                result.total_effect + 1.96 * total_se
             ]
         },
         "method": result.method,
@@ -438,41 +665,67 @@ def evaluate_network_effects_from_df(
     }
 
 
-def _build_adjacency_from_edges(df: pd.DataFrame, edges: pd.DataFrame) -> np.ndarray:
-    """Build adjacency matrix from edge list"""
+def _build_adjacency_from_edges(df: pd.DataFrame, edges: pd.DataFrame) -> sp.csr_matrix:
+    """Build sparse (int8 CSR) adjacency matrix from edge list"""
     n = len(df)
-    adjacency = np.zeros((n, n))
 
-    # Create unit_id to index mapping
+    # unit_id -> row index lookup (the last row wins for duplicated IDs)
     unit_ids = df["unit_id"].values if "unit_id" in df.columns else df.index.values
-    id_to_idx = {uid: i for i, uid in enumerate(unit_ids)}
-
-    # Fill adjacency matrix
-    for _, edge in edges.iterrows():
-        src = edge.get("src")
-        dst = edge.get("dst")
-        if src in id_to_idx and dst in id_to_idx:
-            i = id_to_idx[src]
-            j = id_to_idx[dst]
-            adjacency[i, j] = 1
-            # Assume undirected
-            adjacency[j, i] = 1
-
+    id_to_idx = pd.Series(np.arange(n), index=unit_ids)
+    id_to_idx = id_to_idx[~id_to_idx.index.duplicated(keep="last")]
+
+    if "src" in edges.columns and "dst" in edges.columns:
+        # Encode both endpoint columns in one categorical pass; unknown IDs
+        # get code -1, and codes index into the deduplicated lookup
+        endpoints = np.concatenate([edges["src"].values, edges["dst"].values])
+        codes = pd.Categorical(endpoints, categories=id_to_idx.index).codes.reshape(2, -1)
+        known = (codes >= 0).all(axis=0)
+        i, j = id_to_idx.values[codes[:, known]]
+    else:
+        i = j = np.zeros(0, dtype=np.int64)
+
+    # Assume undirected: store both directions
+    rows = np.concatenate([i, j])
+    cols = np.concatenate([j, i])
+    adjacency = sp.coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n)
+    ).tocsr()
+    # Duplicate edges are summed on conversion; keep the 0/1 pattern
+    adjacency.data[:] = 1
     return adjacency
 
 
-def _build_adjacency_from_clusters(df: pd.DataFrame, cluster_col: str) -> np.ndarray:
-    """Build adjacency matrix from cluster membership"""
+def _build_adjacency_from_clusters(df: pd.DataFrame, cluster_col: str) -> sp.csr_matrix:
+    """Build sparse (int8 CSR) adjacency matrix from cluster membership"""
     n = len(df)
-    adjacency = np.zeros((n, n))
-
-    clusters = df[cluster_col].values
 
-    # Connect all units within same cluster
-    for i in range(n):
-        for j in range(i + 1, n):
-            if clusters[i] == clusters[j]:
-                adjacency[i, j] = 1
-                adjacency[j, i] = 1
+    # Integer cluster codes (missing cluster IDs get -1 and stay unconnected)
+    codes, _ = pd.factorize(df[cluster_col].values)
+
+    # Group unit indices by cluster with one sort
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    _, starts = np.unique(sorted_codes, return_index=True)
+    bounds = np.append(starts, n)
+
+    # Connect all units within same cluster: each cluster is a dense block,
+    # emitted as COO triplets
+    rows, cols = [], []
+    for g in range(len(starts)):
+        if sorted_codes[bounds[g]] < 0:
+            continue
+        idx = order[bounds[g]:bounds[g + 1]]
+        rows.append(np.repeat(idx, len(idx)))
+        cols.append(np.tile(idx, len(idx)))
+
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        off_diag = rows != cols  # No self-loops
+        rows, cols = rows[off_diag], cols[off_diag]
+    else:
+        rows = cols = np.zeros(0, dtype=np.intp)
 
-    return adjacency
+    return sp.coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n)
+    ).tocsr()
@@ -45,6 +45,17 @@ def _get_objective_keywords() -> Dict[str, List[str]]:
 
 OBJECTIVE_KEYWORDS = _get_objective_keywords()
 
+# The hierarchy is read-only, so the concrete → abstract map is fixed at import
+CONCRETE_TO_ABSTRACT = {
+    name: node.parent
+    for name, node in OBJECTIVE_HIERARCHY.items()
+    if node.level == 2
+}
+ABSTRACTS = tuple(get_abstract_objectives())
+
+# Word tokens (compiled once; used for every column name and sample value)
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
 class ObjectiveDetector:
     """
     Detect objective from dataframe using:
@@ -89,12 +100,16 @@ class ObjectiveDetector:
         # Collect all text from column names and sample values
         text_corpus = self._extract_text_corpus(df)
 
+        # Count tokens once; every objective is scored against the same counts
+        token_counts = Counter(text_corpus)
+        total_tokens = len(text_corpus)
+
         # Calculate TF-IDF scores for each concrete objective
         objective_scores = {}
         objective_evidence = {}
 
         for objective, keywords in self.keywords.items():
-            score, evidence = self._calculate_objective_score(text_corpus, keywords)
+            score, evidence = self._calculate_objective_score(token_counts, total_tokens, keywords)
             objective_scores[objective] = score
             objective_evidence[objective] = evidence
 
@@ -108,10 +123,9 @@ class ObjectiveDetector:
         best_score = objective_scores[best_objective]
 
         # Calculate abstract objective scores by summing children
-        abstract_scores = {}
-        for abstract in get_abstract_objectives():
-            children = [d for d in objective_scores.keys() if OBJECTIVE_HIERARCHY == abstract]
-            abstract_scores[abstract] = sum(objective_scores[c] for c in children)
+        abstract_scores = dict.fromkeys(ABSTRACTS, 0.0)
+        for concrete, score in objective_scores.items():
+            abstract_scores[CONCRETE_TO_ABSTRACT[concrete]] += score
 
         # Get hierarchy path
         objective_path = get_objective_path(best_objective)
@@ -140,42 +154,40 @@ class ObjectiveDetector:
     
     def _extract_text_corpus(self, df: pd.DataFrame) -> List[str]:
         """Extract text from column names and sample values"""
-        corpus = []
-        
-        # Column names
-        for col in df.columns:
-            corpus.extend(self._tokenize(col))
-        
-        # Sample values from object/string columns
+        # Column names and sample values from object/string columns, joined
+        # into one string (spaces are word boundaries, so tokens are the same
+        # as tokenizing each piece) and tokenized in a single regex scan
+        parts = [' '.join(df.columns.astype(str))]
         for col in df.select_dtypes(include=['object']).columns:
-            sample_values = df[col].dropna().head(100).astype(str)
-            for val in sample_values:
-                corpus.extend(self._tokenize(val))
+            parts.append(df[col].dropna().head(100).astype(str).str.cat(sep=' '))
         
-        return corpus
+        return self._tokenize(' '.join(parts))
     
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text into lowercase words"""
         # First split on underscores and other separators
         text_lower = text.lower().replace('_', ' ').replace('-', ' ')
         # Then extract words
-        tokens = re.findall(r'\b\w+\b', text_lower)
+        tokens = _TOKEN_RE.findall(text_lower)
         return tokens
     
     def _calculate_objective_score(
         self, 
-        corpus: List[str], 
+        corpus_counter: Counter, 
+        total_tokens: int,
         keywords: List[str]
     ) -> Tuple[float, List[str]]:
         """
         Calculate TF-IDF style score for objective
+
+        Args:
+            corpus_counter: Token counts of the whole corpus
+            total_tokens: Number of tokens in the corpus
+            keywords: Keywords of the objective
         
         Returns:
             (score, matched_keywords)
         """
-        corpus_counter = Counter(corpus)
-        total_tokens = len(corpus)
-        
         score = 0.0
         evidence = []
         
@@ -9,8 +9,11 @@ Objective Hierarchy: Abstract ↔ Concrete Design
 - Level 2 (Concrete): 具体的な適用領域
 """
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +31,8 @@ class ObjectiveNode:
         if self.keywords is None:
             self.keywords = []
 
-# 目的階層定義
-OBJECTIVE_HIERARCHY = {
+# 目的階層定義 (raw definition; exported read-only as OBJECTIVE_HIERARCHY)
+_OBJECTIVE_HIERARCHY: Dict[str, ObjectiveNode] = {
     # Level 0: Root
     "causal_inference": ObjectiveNode(
         name="causal_inference",
@@ -181,8 +184,24 @@ OBJECTIVE_HIERARCHY = {
     ),
 }
 
-def get_objective_hierarchy() -> Dict[str, ObjectiveNode]:
-    """目的階層を取得"""
+def _intern_hierarchy(raw: Dict[str, ObjectiveNode]) -> Dict[str, ObjectiveNode]:
+    """名前・親・キーワードをsys.internし、キー比較を同一性チェックで済ませる"""
+    interned = {}
+    for name, node in raw.items():
+        node.name = sys.intern(node.name)
+        if node.parent is not None:
+            node.parent = sys.intern(node.parent)
+        node.keywords = [sys.intern(kw) for kw in node.keywords]
+        interned[sys.intern(name)] = node
+    return interned
+
+# Read-only view: callers cannot add, remove or replace objectives
+OBJECTIVE_HIERARCHY: Mapping[str, ObjectiveNode] = MappingProxyType(
+    _intern_hierarchy(_OBJECTIVE_HIERARCHY)
+)
+
+def get_objective_hierarchy() -> Mapping[str, ObjectiveNode]:
+    """目的階層を取得 (読み取り専用)"""
     return OBJECTIVE_HIERARCHY
 
 def get_concrete_objectives() -> List[str]:
@@ -208,8 +227,13 @@ def get_children_objectives(objective: str) -> List[str]:
 
 def get_objective_path(objective: str) -> List[str]:
     """目的の階層パスを取得 (root → abstract → concrete)"""
+    return list(_objective_path(objective))
+
+@lru_cache(maxsize=None)
+def _objective_path(objective: str) -> Tuple[str, ...]:
+    """get_objective_pathの本体 (階層は不変なのでメモ化; 呼び出し側にはコピーを返す)"""
     if objective not in OBJECTIVE_HIERARCHY:
-        return []
+        return ()
 
     path = [objective]
     current = objective
@@ -218,7 +242,7 @@ def get_objective_path(objective: str) -> List[str]:
         path.insert(0, parent)
         current = parent
 
-    return path
+    return tuple(path)
 
 def get_causal_structure(objective: str) -> str:
     """目的の因果構造を取得"""
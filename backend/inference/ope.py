@@ -19,6 +19,90 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Estimator codes for _ope_moments
+_IPS, _SNIPS, _DR = 0, 1, 2
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ope_moments(treatment, new_policy, outcome, inv_prop, mu_0, mu_1, method_code):
+        """
+        Fused IPS/SNIPS/DR moments over the logged sample
+
+        Per unit: w = 1/π₀ where the logged action matches the new policy
+        (else 0), and the contribution c = w·y (IPS/SNIPS) or
+        c = μ(π(x)) + w·(y - μ(a)) (DR). Two streaming passes, no temporaries:
+        the first gives Σw, Σw², Σc; the second the sum of squared deviations
+        of the per-unit term whose sample variance each estimator reports
+        (c for IPS/DR, w·(y - V) for SNIPS).
+
+        Returns:
+            (value, M2, Σw, Σw²)
+        """
+        n = outcome.shape[0]
+        s_w = 0.0
+        s_w2 = 0.0
+        s_c = 0.0
+        for i in prange(n):
+            w = inv_prop[i] if treatment[i] == new_policy[i] else 0.0
+            if method_code == 2:
+                mu = mu_1 if new_policy[i] == 1 else mu_0
+                mu_logged = mu_1 if treatment[i] == 1 else mu_0
+                c = mu + w * (outcome[i] - mu_logged)
+            else:
+                c = w * outcome[i]
+            s_w += w
+            s_w2 += w * w
+            s_c += c
+
+        if method_code == 1:
+            value = s_c / (s_w + 1e-10)
+            center = (s_c - value * s_w) / n  # mean of w·(y - V)
+        else:
+            value = s_c / n
+            center = value
+
+        m2 = 0.0
+        for i in prange(n):
+            w = inv_prop[i] if treatment[i] == new_policy[i] else 0.0
+            if method_code == 2:
+                mu = mu_1 if new_policy[i] == 1 else mu_0
+                mu_logged = mu_1 if treatment[i] == 1 else mu_0
+                d = mu + w * (outcome[i] - mu_logged) - center
+            elif method_code == 1:
+                d = w * (outcome[i] - value) - center
+            else:
+                d = w * outcome[i] - center
+            m2 += d * d
+
+        return value, m2, s_w, s_w2
+else:
+    def _ope_moments(treatment, new_policy, outcome, inv_prop, mu_0, mu_1, method_code):
+        """NumPy fallback for the fused OPE moments (see the numba version)"""
+        n = outcome.shape[0]
+        weights = np.where(treatment == new_policy, inv_prop, 0.0)
+        w_sum = weights.sum()
+
+        if method_code == _DR:
+            mu = np.where(new_policy == 1, mu_1, mu_0)
+            terms = mu + weights * (outcome - np.where(treatment == 1, mu_1, mu_0))
+            value = terms.mean()
+        elif method_code == _SNIPS:
+            value = (weights * outcome).sum() / (w_sum + 1e-10)
+            terms = weights * (outcome - value)
+        else:
+            terms = weights * outcome
+            value = terms.mean()
+
+        m2 = ((terms - terms.mean()) ** 2).sum()
+        return value, m2, w_sum, (weights ** 2).sum()
+
 
 @dataclass
 class OPEResult:
@@ -76,6 +160,20 @@ class OffPolicyEvaluator:
         else:
             self.df["_profit"] = df[outcome_col] * value_per_y
 
+        # Sample arrays, extracted once: every evaluate_* call (and each point
+        # of a coverage sweep) reads these instead of going through pandas
+        self._treatment = np.ascontiguousarray(self.df[treatment_col].to_numpy())
+        self._outcome = np.ascontiguousarray(self.df["_profit"].to_numpy(), dtype=np.float64)
+        self._propensity = np.ascontiguousarray(self.df["_propensity"].to_numpy(), dtype=np.float64)
+        self._inv_prop = 1.0 / (self._propensity + 1e-10)
+
+        # DR outcome models μ(a) (conditional sample means; in production,
+        # use ML models). They do not depend on the evaluated policy
+        treated = self._treatment == 1
+        control = self._treatment == 0
+        self._mu_0 = float(self._outcome[control].mean()) if control.any() else 0.0
+        self._mu_1 = float(self._outcome[treated].mean()) if treated.any() else 0.0
+
     def evaluate_policy(
         self,
         new_policy: np.ndarray,
@@ -115,26 +213,15 @@ class OffPolicyEvaluator:
         Returns:
             OPEResult
         """
-        logged_treatment = self.df[self.treatment_col].values
-        outcome = self.df["_profit"].values
-        propensity = self.df["_propensity"].values
-
         # Importance weights
         # w_i = π(a_i|x_i) / π₀(a_i|x_i)
         # For binary treatment: π(a) = π if a=new_policy[i] else (1-π)
-        weights = np.where(
-            logged_treatment == new_policy,
-            1.0 / (propensity + 1e-10),  # Matched
-            0.0  # Mismatched
-        )
-
-        # IPS estimator
-        weighted_outcomes = weights * outcome
-        value = weighted_outcomes.mean()
+        # IPS estimator: mean of w·Y, from the fused moment pass
+        value, m2, w_sum, w2_sum = self._moments(new_policy, _IPS)
 
         # Standard error (with Horvitz-Thompson variance)
-        n = len(outcome)
-        variance = np.var(weighted_outcomes, ddof=1) / n
+        n = len(self._outcome)
+        variance = m2 / (n - 1) / n
         std_error = np.sqrt(variance)
 
         # Confidence interval
@@ -143,7 +230,7 @@ class OffPolicyEvaluator:
         ci_upper = value + z_score * std_error
 
         # Effective sample size
-        ess = (weights.sum() ** 2) / (weights ** 2).sum() if weights.sum() > 0 else 0
+        ess = (w_sum ** 2) / w2_sum if w_sum > 0 else 0
 
         return OPEResult(
             method="ips",
@@ -170,28 +257,14 @@ class OffPolicyEvaluator:
         Returns:
             OPEResult
         """
-        logged_treatment = self.df[self.treatment_col].values
-        outcome = self.df["_profit"].values
-        propensity = self.df["_propensity"].values
-
-        # Importance weights
-        weights = np.where(
-            logged_treatment == new_policy,
-            1.0 / (propensity + 1e-10),
-            0.0
-        )
-
-        # SNIPS estimator
-        value = (weights * outcome).sum() / (weights.sum() + 1e-10)
+        # SNIPS estimator: Σ[Y * w] / Σ[w], from the fused moment pass
+        value, m2, w_sum, w2_sum = self._moments(new_policy, _SNIPS)
 
         # Standard error (delta method)
-        n = len(outcome)
-        w_sum = weights.sum()
-        wy_sum = (weights * outcome).sum()
+        n = len(self._outcome)
 
-        # Variance using delta method
-        residuals = weights * (outcome - value)
-        variance = np.var(residuals, ddof=1) / (n * (w_sum / n) ** 2)
+        # Variance using delta method (m2: squared deviations of w·(Y - V))
+        variance = m2 / (n - 1) / (n * (w_sum / n) ** 2)
         std_error = np.sqrt(variance)
 
         # Confidence interval
@@ -200,7 +273,7 @@ class OffPolicyEvaluator:
         ci_upper = value + z_score * std_error
 
         # Effective sample size
-        ess = (w_sum ** 2) / ((weights ** 2).sum() + 1e-10)
+        ess = (w_sum ** 2) / (w2_sum + 1e-10)
 
         return OPEResult(
             method="snips",
@@ -227,36 +300,13 @@ class OffPolicyEvaluator:
         Returns:
             OPEResult
         """
-        # Estimate outcome models μ(x,a) for a=0,1
-        # For simplicity, use sample means (in production, use ML models)
-        outcome = self.df["_profit"].values
-        logged_treatment = self.df[self.treatment_col].values
-        propensity = self.df["_propensity"].values
-
-        # Outcome models (conditional expectations)
-        mu_0 = outcome[logged_treatment == 0].mean() if (logged_treatment == 0).any() else 0
-        mu_1 = outcome[logged_treatment == 1].mean() if (logged_treatment == 1).any() else 0
-
-        # DR estimator components
-        # 1. Outcome model prediction
-        mu = np.where(new_policy == 1, mu_1, mu_0)
-
-        # 2. Propensity-weighted residual
-        weights = np.where(
-            logged_treatment == new_policy,
-            1.0 / (propensity + 1e-10),
-            0.0
-        )
-        residuals = outcome - np.where(logged_treatment == 1, mu_1, mu_0)
-        correction = weights * residuals
-
-        # DR estimate
-        dr_values = mu + correction
-        value = dr_values.mean()
+        # Outcome models μ(x,a) for a=0,1 (sample means, fixed per evaluator)
+        # DR estimate: mean of μ(x,π(x)) + w·(Y - μ(x,a)), from the fused pass
+        value, m2, w_sum, w2_sum = self._moments(new_policy, _DR)
 
         # Standard error
-        n = len(outcome)
-        variance = np.var(dr_values, ddof=1) / n
+        n = len(self._outcome)
+        variance = m2 / (n - 1) / n
         std_error = np.sqrt(variance)
 
         # Confidence interval
@@ -265,7 +315,7 @@ class OffPolicyEvaluator:
         ci_upper = value + z_score * std_error
 
         # Effective sample size
-        ess = (weights.sum() ** 2) / ((weights ** 2).sum() + 1e-10) if weights.sum() > 0 else n
+        ess = (w_sum ** 2) / (w2_sum + 1e-10) if w_sum > 0 else n
 
         return OPEResult(
             method="dr",
@@ -277,6 +327,16 @@ class OffPolicyEvaluator:
             effective_sample_size=ess
         )
 
+    def _moments(self, new_policy: np.ndarray, method_code: int) -> Tuple[float, ...]:
+        """Fused moments (value, M2, Σw, Σw²) of one estimator for new_policy"""
+        value, m2, w_sum, w2_sum = _ope_moments(
+            self._treatment, np.asarray(new_policy), self._outcome, self._inv_prop,
+            self._mu_0, self._mu_1, method_code
+        )
+        # NumPy scalars keep the previous inf/nan (not exception) behavior on
+        # degenerate samples
+        return np.float64(value), np.float64(m2), np.float64(w_sum), np.float64(w2_sum)
+
     def evaluate_coverage(
         self,
         coverage: float,
@@ -294,20 +354,32 @@ class OffPolicyEvaluator:
         Returns:
             OPEResult
         """
-        if score_col and score_col in self.df.columns:
-            scores = self.df[score_col].values
-        else:
-            scores = self.df["_propensity"].values
+        scores = self._coverage_scores(score_col)
 
         # Top k% policy
-        k = int(len(scores) * coverage)
-        top_k_idx = np.argsort(scores)[-k:]
-
-        new_policy = np.zeros(len(scores), dtype=int)
-        new_policy[top_k_idx] = 1
+        new_policy = np.zeros(len(scores), dtype=np.int8)
+        new_policy[self._top_k_indices(scores, coverage)] = 1
 
         return self.evaluate_policy(new_policy, method=method)
 
+    def _coverage_scores(self, score_col: Optional[str]) -> np.ndarray:
+        """Ranking scores for coverage policies (propensity if score_col is unavailable)"""
+        if score_col and score_col in self.df.columns:
+            return self.df[score_col].values
+        return self._propensity
+
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, coverage: float) -> np.ndarray:
+        """Indices of the top int(n·coverage) scores (unordered)"""
+        n = len(scores)
+        k = int(n * coverage)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k >= n:
+            return np.arange(n)
+        # O(n) selection: order inside the top-k does not matter for the mask
+        return np.argpartition(scores, -k)[-k:]
+
     def sweep_coverage(
         self,
         coverage_range: List[float],
@@ -325,18 +397,28 @@ class OffPolicyEvaluator:
         Returns:
             DataFrame with coverage, value, ci_lower, ci_upper
         """
-        results = []
-
-        for cov in coverage_range:
-            result = self.evaluate_coverage(cov, score_col, method)
-            results.append({
+        scores = self._coverage_scores(score_col)
+        results = [None] * len(coverage_range)
+
+        # Walk coverages in ascending order, reusing one policy buffer and
+        # clearing only the previously selected units between points
+        new_policy = np.zeros(len(scores), dtype=np.int8)
+        top_k_idx = np.empty(0, dtype=np.intp)
+        for pos in np.argsort(coverage_range, kind="stable"):
+            cov = coverage_range[pos]
+            new_policy[top_k_idx] = 0
+            top_k_idx = self._top_k_indices(scores, cov)
+            new_policy[top_k_idx] = 1
+
+            result = self.evaluate_policy(new_policy, method=method)
+            results[pos] = {
                 "coverage": cov,
                 "value": result.value,
                 "std_error": result.std_error,
                 "ci_lower": result.ci_lower,
                 "ci_upper": result.ci_upper,
                 "ess": result.effective_sample_size
-            })
+            }
 
         return pd.DataFrame(results)
 
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+
+N_UNITS = 500
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture
+def units(rng):
+    """(y, t, x): binary treatment, one covariate and a linear outcome"""
+    t = rng.integers(0, 2, N_UNITS).astype(float)
+    x = rng.normal(size=N_UNITS)
+    y = 0.2 * t + 0.3 * x + rng.normal(size=N_UNITS)
+    return y, t, x
+
+
+@pytest.fixture
+def adjacency():
+    """Symmetric random int8 CSR network over the units"""
+    A = sp.random(N_UNITS, N_UNITS, density=0.02, random_state=0, format="csr")
+    return ((A + A.T) > 0).astype(np.int8)
+
+
+@pytest.fixture
+def coordinates(rng):
+    return rng.uniform(0, 10, (N_UNITS, 2))
+
+
+@pytest.fixture
+def logged_df(units, rng):
+    """Logged policy data in the OffPolicyEvaluator column layout"""
+    y, t, x = units
+    return pd.DataFrame({
+        "treatment": t.astype(int),
+        "y": y,
+        "log_propensity": rng.uniform(0.1, 0.9, N_UNITS),
+        "score": x,
+    })
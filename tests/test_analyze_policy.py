@@ -1,5 +1,9 @@
+import json
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from backend.engine.server import analyze
+from backend.inference.network_effects import NetworkAnalyzer
 import asyncio
 
 def test_analyze_smoke(tmp_path, monkeypatch):
@@ -11,3 +15,33 @@ def test_analyze_smoke(tmp_path, monkeypatch):
     resp = loop.run_until_complete(analyze(payload))
     assert resp.status_code==200
 
+
+def test_analyze_network_estimator(tmp_path, monkeypatch, rng):
+    # Record the adjacency the engine hands to the network estimator
+    adjacencies = []
+    estimate = NetworkAnalyzer.estimate
+
+    def recording_estimate(self, y, treatment, adjacency_matrix, *args, **kwargs):
+        adjacencies.append(adjacency_matrix)
+        return estimate(self, y, treatment, adjacency_matrix, *args, **kwargs)
+
+    monkeypatch.setattr(NetworkAnalyzer, "estimate", recording_estimate)
+
+    n = 600
+    p = tmp_path/"d.csv"
+    df = pd.DataFrame({"user_id":range(n),"treatment":rng.integers(0,2,n),"y":rng.normal(size=n),
+                       "cluster_id":rng.integers(0,20,n),"neighbor_exposure":rng.uniform(size=n),
+                       "x1":rng.uniform(size=n),"x2":rng.uniform(size=n)})
+    df.to_csv(p, index=False)
+    mapping={"y":"y","treatment":"treatment","unit_id":"user_id",
+             "cluster_id":"cluster_id","neighbor_exposure":"neighbor_exposure"}
+    payload={"dataset_id":"x","df_path":str(p),"mapping":mapping}
+    loop=asyncio.get_event_loop()
+    resp = loop.run_until_complete(analyze(payload))
+    assert resp.status_code==200
+
+    network = next(r for r in json.loads(resp.body)["results"] if r["name"]=="network")
+    assert network["status"]=="success"
+    assert np.isfinite(network["tau_hat"]) and np.isfinite(network["se"])
+    assert len(adjacencies)==1
+    assert sp.issparse(adjacencies[0]) and adjacencies[0].format=="csr"
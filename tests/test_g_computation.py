@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backend.inference.g_computation import GComputationEvaluator
+
+
+@pytest.fixture
+def gcomp_df(units):
+    y, t, x = units
+    # Treatment effect heterogeneous in x
+    return pd.DataFrame({"treatment": t, "y": y + t * x, "X_0": x})
+
+
+def test_refit_false_rejects_other_method(gcomp_df):
+    evaluator = GComputationEvaluator(gcomp_df)
+    policy = np.ones(len(gcomp_df), dtype=int)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_policy(policy, refit=False)
+
+    evaluator.fit_outcome_model(method="linear", compute_r2=False)
+    assert evaluator.evaluate_policy(policy, refit=False).method == "linear"
+    assert evaluator.evaluate_policy(policy, method="linear", refit=False).method == "linear"
+    with pytest.raises(ValueError):
+        evaluator.evaluate_policy(policy, method="rf", refit=False)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_coverage(0.5, method="rf", refit=False)
+
+
+def test_coverage_on_non_range_index(gcomp_df):
+    df = gcomp_df.set_index(np.arange(len(gcomp_df))[::-1] * 10 + 7)
+    evaluator = GComputationEvaluator(df)
+    evaluator.fit_outcome_model(method="linear", compute_r2=False)
+
+    none = evaluator.evaluate_coverage(0.0, refit=False)
+    everyone = evaluator.evaluate_coverage(1.0, refit=False)
+    assert not np.isclose(none.value, everyone.value)
+    assert np.isclose(none.value, evaluator.predict_counterfactual(df, 0).mean())
+    assert np.isclose(everyone.value, evaluator.predict_counterfactual(df, 1).mean())
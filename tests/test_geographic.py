@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from scipy.spatial import cKDTree
+from backend.inference.geographic import (
+    HAS_NUMBA,
+    DistanceBasedAdjustment,
+    SpatialMatching,
+    _grid_match,
+)
+
+
+def test_distance_adjustment_rank_deficient_covariates(units, coordinates):
+    y, t, x = units
+    n = len(y)
+    ref = DistanceBasedAdjustment().estimate(y, t, coordinates, X=x[:, None])
+    for X in (np.column_stack([x, np.ones(n)]), np.column_stack([x, x])):
+        res = DistanceBasedAdjustment().estimate(y, t, coordinates, X=X)
+        assert np.isclose(res.ate, ref.ate)
+        assert np.isclose(res.se, ref.se)
+        assert np.isclose(res.ci_lower, ref.ci_lower)
+
+
+def test_grid_match_agrees_with_kdtree(rng):
+    caliper = 0.05
+    for dim in (2, 3):
+        points = rng.uniform(0, 1, (5000, dim))
+        candidates = rng.uniform(0, 1, (5000, dim))
+        match = _grid_match(points, candidates, caliper)
+        if dim != 2 or not HAS_NUMBA:
+            assert match is None
+            continue
+        distances, indices = match
+        tree_distances, tree_indices = cKDTree(candidates).query(
+            points, k=1, distance_upper_bound=caliper
+        )
+        assert np.array_equal(np.isfinite(distances), np.isfinite(tree_distances))
+        assert np.array_equal(indices, tree_indices)
+        matched = np.isfinite(distances)
+        assert np.allclose(distances[matched], tree_distances[matched])
+
+
+def test_spatial_matching_paired_se():
+    # Four treated units, each with its control 0.1-0.4 away along x; the last
+    # treated unit has no control within the caliper
+    coords = np.array([[0.0, 0.0], [10.0, 0.0], [20.0, 0.0], [30.0, 0.0], [50.0, 0.0],
+                       [0.1, 0.0], [10.2, 0.0], [20.3, 0.0], [30.4, 0.0]])
+    treatment = np.array([1, 1, 1, 1, 1, 0, 0, 0, 0])
+    y = np.array([3.0, 5.0, 4.0, 7.0, 100.0, 1.0, 2.0, 2.5, 3.0])
+    diffs = np.array([2.0, 3.0, 1.5, 4.0])
+
+    res = SpatialMatching(caliper=1.0, compute_morans_i=False).estimate(y, treatment, coords)
+    assert res.diagnostics["n_matches"] == 4
+    assert np.isclose(res.ate, diffs.mean())
+    assert np.isclose(res.se, diffs.std(ddof=1) / np.sqrt(len(diffs)))
+    assert np.isclose(res.diagnostics["avg_match_distance"], 0.25)
+
+    # The caliper is a strict bound, so a zero caliper admits no matches
+    with pytest.raises(ValueError):
+        SpatialMatching(caliper=0.0, compute_morans_i=False).estimate(y, treatment, coords)
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from backend.inference import network_effects
+from backend.inference.content_cache import LRUCache
+from backend.inference.network_effects import (
+    HorvitzThompson,
+    LinearInMeans,
+    evaluate_network_effects_from_df,
+)
+
+
+def test_lim_rank_deficient_covariates(units, adjacency):
+    y, t, x = units
+    n = len(y)
+    ref = LinearInMeans().estimate(y, t, adjacency, X=x[:, None])
+    for X in (np.column_stack([x, np.full(n, 3.0)]), np.column_stack([x, x])):
+        res = LinearInMeans().estimate(y, t, adjacency, X=X)
+        assert np.isclose(res.direct_effect, ref.direct_effect)
+        assert np.isclose(res.spillover_effect, ref.spillover_effect)
+        assert np.isclose(res.direct_se, ref.direct_se)
+        assert np.isclose(res.spillover_se, ref.spillover_se)
+
+
+def test_lim_se_matches_ols_covariance(units, adjacency):
+    y, t, x = units
+    n = len(y)
+    res = LinearInMeans().estimate(y, t, adjacency, X=x[:, None])
+
+    # Independent OLS with intercept: Y ~ 1 + D + mean(D_neighbors) + X
+    dense = adjacency.toarray() > 0
+    deg = dense.sum(axis=1)
+    neighbor_t = np.divide(dense @ t, deg, out=np.zeros(n), where=deg > 0)
+    design = np.column_stack([np.ones(n), t, neighbor_t, x])
+    beta, rss, _, _ = np.linalg.lstsq(design, y, rcond=None)
+    cov = rss[0] / (n - design.shape[1]) * np.linalg.inv(design.T @ design)
+
+    assert np.isclose(res.direct_effect, beta[1], rtol=1e-5)
+    assert np.isclose(res.spillover_effect, beta[2], rtol=1e-5)
+    assert np.isclose(res.direct_se, np.sqrt(cov[1, 1]), rtol=1e-5)
+    assert np.isclose(res.spillover_se, np.sqrt(cov[2, 2]), rtol=1e-5)
+
+
+def test_edge_adjacency_cache_keys_on_endpoints(units, adjacency, monkeypatch):
+    y, t, x = units
+    df = pd.DataFrame({"unit_id": np.arange(len(y)) + 100, "treatment": t, "y": y, "X_0": x})
+    src, dst = sp.triu(adjacency).nonzero()
+    edges = pd.DataFrame({"src": src + 100, "dst": dst + 100, "weight": 1.0})
+
+    builds = []
+    build = network_effects._build_adjacency_from_edges
+
+    def counting_build(*args):
+        builds.append(args)
+        return build(*args)
+
+    monkeypatch.setattr(network_effects, "_adjacency_cache", LRUCache(maxsize=8))
+    monkeypatch.setattr(network_effects, "_build_adjacency_from_edges", counting_build)
+
+    # Same endpoint values without src/dst names: an edgeless network
+    unnamed = edges.rename(columns={"src": "a", "dst": "b"})
+    assert evaluate_network_effects_from_df(df, edges=unnamed)["diagnostics"]["n_edges"] == 0
+
+    first = evaluate_network_effects_from_df(df, edges=edges)
+    assert first["diagnostics"]["n_edges"] == adjacency.nnz
+
+    # Columns the builder does not read still hit the cache
+    second = evaluate_network_effects_from_df(df, edges=edges.assign(weight=2.0))
+    assert second == first
+    assert len(builds) == 2
+
+
+def test_ht_bootstrap_se_independent_of_n_jobs(units, adjacency):
+    y, t, _ = units
+    ses = []
+    for n_jobs in (1, 2, 3):
+        ht = HorvitzThompson(se_method="bootstrap", n_bootstrap=60, n_jobs=n_jobs, random_state=7)
+        res = ht.estimate(y, t, adjacency)
+        ses.append((res.direct_se, res.spillover_se))
+    assert ses[0] == ses[1] == ses[2]
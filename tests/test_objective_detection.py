@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+from backend.inference.objective_detection import (
+    CONCRETE_TO_ABSTRACT,
+    detect_objective_from_dataframe,
+)
+
+
+def test_abstract_scores_sum_children():
+    df = pd.DataFrame({
+        "student_id": range(20),
+        "school": ["north", "south"] * 10,
+        "customer_purchase": np.linspace(0, 1, 20),
+    })
+    result = detect_objective_from_dataframe(df)
+    abstract_scores = result["abstract_scores"]
+
+    assert np.isclose(sum(abstract_scores.values()), 1.0)
+    assert abstract_scores[CONCRETE_TO_ABSTRACT["education"]] > 0
+    assert abstract_scores[CONCRETE_TO_ABSTRACT["retail"]] > 0
+    for abstract, score in abstract_scores.items():
+        children = [c for c, a in CONCRETE_TO_ABSTRACT.items() if a == abstract]
+        assert np.isclose(score, sum(result["scores"][c] for c in children))
@@ -0,0 +1,22 @@
+import numpy as np
+from backend.inference.ope import OffPolicyEvaluator
+
+
+def test_sweep_coverage_matches_per_point_evaluation(logged_df):
+    n = len(logged_df)
+    coverage_range = [0.5, 0.0, 1.0, 0.1, 0.5, 0.3]
+    for method in ("ips", "snips", "dr"):
+        evaluator = OffPolicyEvaluator(logged_df)
+        sweep = evaluator.sweep_coverage(coverage_range, "score", method)
+        assert list(sweep["coverage"]) == coverage_range
+        for row, cov in zip(sweep.itertuples(), coverage_range):
+            result = evaluator.evaluate_coverage(cov, "score", method)
+            assert np.isclose(row.value, result.value)
+            assert np.isclose(row.std_error, result.std_error)
+            assert np.isclose(row.ess, result.effective_sample_size)
+
+        # Coverage 0 treats nobody and coverage 1 treats everyone
+        none = evaluator.evaluate_policy(np.zeros(n, dtype=int), method=method)
+        everyone = evaluator.evaluate_policy(np.ones(n, dtype=int), method=method)
+        assert np.isclose(sweep["value"][1], none.value)
+        assert np.isclose(sweep["value"][2], everyone.value)